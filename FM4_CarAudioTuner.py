@@ -3,17 +3,23 @@ FM4 Car Audio Tuner
 Forza Motorsport 4 Engine Tuning XML Editor
 """
 
+import collections
 import copy
+import functools
 import json
+import mmap
 import os
 import re
 import struct
 import sys
 import shutil
 import subprocess
+import threading
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, simpledialog
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # --- Paths (relative to script/exe location) ---
 if getattr(sys, "frozen", False):
@@ -30,21 +36,38 @@ DLC_ET_DIR = os.path.join(BASE_DIR, "dlc_enginetuning")
 DLC_HT_DIR = os.path.join(BASE_DIR, "dlc_harmonictuning")
 FILE_MAPPING_PATH = os.path.join(BASE_DIR, "file_mapping.json")
 DEFAULT_SCAN_ROOT = r"C:\Emulators"
-
+IO_BUFFER_SIZE = 1 << 20  # 1 MiB buffers for file writes/copies
+CAR_LIST_PAGE = 200       # car list rows shown per page; a tail row loads more
+TREE_CACHE_SIZE = 8       # parsed car XMLs kept for re-selecting recent cars
+UNDO_LEVELS = 50
+
+# Cylinder counts whose harmonics mix cleanly; members share one frozenset
+_CYL_EVEN = frozenset(("2", "4", "8", "16"))
+_CYL_THREES = frozenset(("3", "6", "12"))
+_CYL_FIVES = frozenset(("5", "10"))
 CYLINDER_GROUPS = {
-    "2": ["2", "4", "8", "16"], "4": ["2", "4", "8", "16"],
-    "8": ["2", "4", "8", "16"], "16": ["2", "4", "8", "16"],
-    "3": ["3", "6", "12"], "6": ["3", "6", "12"], "12": ["3", "6", "12"],
-    "5": ["5", "10"], "10": ["5", "10"],
-    "Rotary": ["2R"],
+    "2": _CYL_EVEN, "4": _CYL_EVEN, "8": _CYL_EVEN, "16": _CYL_EVEN,
+    "3": _CYL_THREES, "6": _CYL_THREES, "12": _CYL_THREES,
+    "5": _CYL_FIVES, "10": _CYL_FIVES,
+    "Rotary": frozenset(("2R",)),
 }
-CYLINDER_OPTIONS = ["4", "5", "6", "8", "10", "12", "Rotary"]
+CYLINDER_OPTIONS = ("4", "5", "6", "8", "10", "12", "Rotary")
+# HT cylinder key -> Cyl dropdown option (an option itself, else the first option whose group has it)
+CYLINDER_KEY_TO_OPTION = {k: opt for opt in reversed(CYLINDER_OPTIONS) for k in CYLINDER_GROUPS.get(opt, ())}
+CYLINDER_KEY_TO_OPTION.update((opt, opt) for opt in CYLINDER_OPTIONS)
 
 
 # ============================================================
 # Reusable Widgets
 # ============================================================
 
+def _set_entry_text(entry, text):
+    """Replace an Entry's text, skipping the delete/insert when it already matches."""
+    if entry.get() != text:
+        entry.delete(0, tk.END)
+        entry.insert(0, text)
+
+
 class PhysCoefEditor(ttk.Frame):
     """4 sliders for RPM, Throttle, PosTorque, NegTorque constrained to sum <= 1.0."""
     LABELS = ["RPM", "Thr", "Pos", "Neg"]
@@ -52,6 +75,8 @@ class PhysCoefEditor(ttk.Frame):
     def __init__(self, parent, on_change=None, **kw):
         super().__init__(parent, **kw)
         self._vars = []
+        self._values = [0.0] * len(self.LABELS)  # Python mirror of _vars, read without Tcl calls
+        self.revision = 0                          # bumped whenever _values changes
         self._scales = []
         self._entries = []
         self._updating = False
@@ -62,7 +87,7 @@ class PhysCoefEditor(ttk.Frame):
             var = tk.DoubleVar(value=0.0)
             self._vars.append(var)
             s = ttk.Scale(self, from_=0.0, to=1.0, orient=tk.HORIZONTAL, length=100,
-                          variable=var, command=lambda val, idx=i: self._on_slider(idx))
+                          variable=var, command=lambda val, idx=i: self._on_slider(idx, val))
             s.grid(row=i, column=1, padx=2)
             self._scales.append(s)
             e = ttk.Entry(self, width=5, font=("Segoe UI", 8))
@@ -71,57 +96,61 @@ class PhysCoefEditor(ttk.Frame):
             e.bind("<FocusOut>", lambda ev, idx=i: self._on_entry(idx))
             self._entries.append(e)
 
-    def _on_slider(self, changed_idx):
+    def _on_slider(self, changed_idx, value):
         if self._updating:
             return
         self._updating = True
-        vals = [v.get() for v in self._vars]
+        vals = self._values
+        vals[changed_idx] = float(value)
         total = sum(vals)
         if total > 1.0:
-            excess = total - 1.0
-            others_sum = sum(vals[i] for i in range(4) if i != changed_idx)
+            others_sum = total - vals[changed_idx]
             if others_sum > 0:
-                for i in range(4):
-                    if i != changed_idx:
-                        self._vars[i].set(max(0, vals[i] - excess * (vals[i] / others_sum)))
+                # Shrink the other sliders by one common factor; zeros stay put
+                scale = max(0.0, 1.0 - (total - 1.0) / others_sum)
+                for i, var in enumerate(self._vars):
+                    if i != changed_idx and vals[i] > 0:
+                        vals[i] *= scale
+                        var.set(vals[i])
             else:
+                vals[changed_idx] = 1.0
                 self._vars[changed_idx].set(1.0)
+        self.revision += 1
         self._sync_entries()
         self._updating = False
         if self._on_change:
             self._on_change()
 
     def is_all_zero(self):
-        return all(v.get() < 0.0001 for v in self._vars)
+        return all(v < 0.0001 for v in self._values)
 
     def _on_entry(self, idx):
         try:
             val = float(self._entries[idx].get())
             val = max(0.0, min(1.0, val))
             self._vars[idx].set(val)
-            self._on_slider(idx)
+            self._on_slider(idx, val)
         except ValueError:
             pass
 
     def _sync_entries(self):
-        for i, e in enumerate(self._entries):
-            e.delete(0, tk.END)
-            e.insert(0, f"{self._vars[i].get():.3f}")
+        for e, val in zip(self._entries, self._values):
+            _set_entry_text(e, f"{val:.3f}")
 
     def set_values(self, rpm, throttle, pos, neg):
         self._updating = True
-        for var, val in zip(self._vars, [rpm, throttle, pos, neg]):
-            var.set(float(val))
+        for i, val in enumerate((rpm, throttle, pos, neg)):
+            self._values[i] = float(val)
+            self._vars[i].set(self._values[i])
+        self.revision += 1
         self._sync_entries()
         self._updating = False
 
+    KEYS = ("RPM", "Throttle", "PosTorque", "NegTorque")
+
     def get_values(self):
-        return {
-            "RPM": f"{self._vars[0].get():.6f}",
-            "Throttle": f"{self._vars[1].get():.6f}",
-            "PosTorque": f"{self._vars[2].get():.6f}",
-            "NegTorque": f"{self._vars[3].get():.6f}",
-        }
+        """Return ((attr, formatted value), ...) in XML attribute order."""
+        return tuple((k, f"{v:.6f}") for k, v in zip(self.KEYS, self._values))
 
 
 class CurveEditor(ttk.Frame):
@@ -138,6 +167,9 @@ class CurveEditor(ttk.Frame):
         self._y_limit = y_limit
         self._dragging = None
         self._flat_mode = False
+        self._pt_ids = None      # canvas items, created on first _redraw
+        self.revision = 0        # bumped whenever _points changes
+        self._redraw_id = None   # pending after_idle redraw
 
         self.canvas = tk.Canvas(self, width=self.W, height=self.H, bg="#1e1e1e",
                                 highlightthickness=1, highlightbackground="#555")
@@ -174,9 +206,9 @@ class CurveEditor(ttk.Frame):
         y = (self.H - self.PAD - cy) / (self.H - 2 * self.PAD) * self._y_max if self._y_max > 0 else 0
         return max(0, x), max(0, y)
 
-    def _redraw(self):
+    def _build_items(self):
+        """Draw the static grid/axes once and create the items _redraw() moves."""
         c = self.canvas
-        c.delete("all")
         # Grid
         for i in range(5):
             frac = i / 4
@@ -188,28 +220,51 @@ class CurveEditor(ttk.Frame):
         c.create_line(self.PAD, self.H - self.PAD, self.W - self.PAD, self.H - self.PAD, fill="#666")
         c.create_line(self.PAD, self.PAD, self.PAD, self.H - self.PAD, fill="#666")
         # Y max label
-        c.create_text(self.PAD - 2, self.PAD, text=f"{self._y_max:.0f}", anchor="e",
-                       fill="#888", font=("Segoe UI", 6))
+        self._ymax_id = c.create_text(self.PAD - 2, self.PAD, text="", anchor="e",
+                                      fill="#888", font=("Segoe UI", 6))
         c.create_text(self.PAD - 2, self.H - self.PAD, text="0", anchor="e",
-                       fill="#888", font=("Segoe UI", 6))
-        # Lines and Points
+                      fill="#888", font=("Segoe UI", 6))
+        # Lines and Points (positioned by _redraw)
+        self._seg_ids = [c.create_line(0, 0, 0, 0, fill="#aaa", width=2) for _ in range(2)]
+        self._flat_id = c.create_line(0, 0, 0, 0, fill="#aaa", width=1, dash=(4, 4))
+        self._pt_ids = [c.create_oval(0, 0, 0, 0, fill=col, outline="white", width=1, tags=f"pt{i}")
+                        for i, col in enumerate(self.COLORS)]
+        self._drawn_flat = None
+
+    def _schedule_redraw(self):
+        """Coalesce redraws (e.g. per mouse-move) into one per event-loop turn."""
+        if self._redraw_id is None:
+            self._redraw_id = self.after_idle(self._idle_redraw)
+
+    def _idle_redraw(self):
+        self._redraw_id = None
+        self._redraw()
+
+    def _redraw(self):
+        if self._redraw_id is not None:
+            self.after_cancel(self._redraw_id)
+            self._redraw_id = None
+        if self._pt_ids is None:
+            self._build_items()
+        c = self.canvas
+        c.itemconfigure(self._ymax_id, text=f"{self._y_max:.0f}")
         coords = [self._val_to_canvas(p[0], p[1]) for p in self._points]
+        r = self.POINT_R
+        for pt_id, (cx, cy) in zip(self._pt_ids, coords):
+            c.coords(pt_id, cx - r, cy - r, cx + r, cy + r)
         if self._flat_mode:
-            # Flat value - draw horizontal dashed line at y0 across full width
+            # Flat value - horizontal dashed line at y0 across full width
             _, cy0 = coords[0]
-            c.create_line(self.PAD, cy0, self.W - self.PAD, cy0, fill="#aaa", width=1, dash=(4, 4))
-            r = self.POINT_R
-            cx0, _ = coords[0]
-            c.create_oval(cx0 - r, cy0 - r, cx0 + r, cy0 + r, fill=self.COLORS[0],
-                          outline="white", width=1, tags="pt0")
+            c.coords(self._flat_id, self.PAD, cy0, self.W - self.PAD, cy0)
         else:
-            for i in range(len(coords) - 1):
-                c.create_line(coords[i][0], coords[i][1], coords[i + 1][0], coords[i + 1][1],
-                              fill="#aaa", width=2)
-            for i, (cx, cy) in enumerate(coords):
-                r = self.POINT_R
-                c.create_oval(cx - r, cy - r, cx + r, cy + r, fill=self.COLORS[i],
-                              outline="white", width=1, tags=f"pt{i}")
+            for i, seg_id in enumerate(self._seg_ids):
+                c.coords(seg_id, coords[i][0], coords[i][1], coords[i + 1][0], coords[i + 1][1])
+        if self._drawn_flat != self._flat_mode:
+            curve_state = tk.HIDDEN if self._flat_mode else tk.NORMAL
+            for item in (*self._seg_ids, self._pt_ids[1], self._pt_ids[2]):
+                c.itemconfigure(item, state=curve_state)
+            c.itemconfigure(self._flat_id, state=tk.NORMAL if self._flat_mode else tk.HIDDEN)
+            self._drawn_flat = self._flat_mode
 
     def _on_press(self, event):
         for i, pt in enumerate(self._points):
@@ -232,19 +287,19 @@ class CurveEditor(ttk.Frame):
         if y > self._y_max:
             self._y_max = y * 1.2
         self._points[self._dragging] = (x, y)
-        self._redraw()
+        self.revision += 1
+        self._schedule_redraw()
         self._sync_entries()
 
     def _on_release(self, event):
         self._dragging = None
+        if self._redraw_id is not None:
+            self._redraw()
 
     def _sync_entries(self):
-        vals = []
-        for p in self._points:
-            vals.extend(p)
-        for i, e in enumerate(self._entries):
-            e.delete(0, tk.END)
-            e.insert(0, f"{vals[i]:.6f}")
+        texts = [f"{v:.6f}" for p in self._points for v in p]
+        for e, text in zip(self._entries, texts):
+            _set_entry_text(e, text)
 
     def _on_entries_changed(self):
         try:
@@ -253,6 +308,7 @@ class CurveEditor(ttk.Frame):
                 for i in (1, 3, 5):  # y0, y1, y2
                     vals[i] = min(vals[i], self._y_limit)
             self._points = [(vals[0], vals[1]), (vals[2], vals[3]), (vals[4], vals[5])]
+            self.revision += 1
             max_y = max(v for i, v in enumerate(vals) if i % 2 == 1)
             self._y_max = max(1.0, max_y * 1.2) if max_y > 0 else 1.0
             self._redraw()
@@ -262,17 +318,17 @@ class CurveEditor(ttk.Frame):
 
     def set_values(self, x0, y0, x1, y1, x2, y2):
         self._points = [(float(x0), float(y0)), (float(x1), float(y1)), (float(x2), float(y2))]
+        self.revision += 1
         max_y = max(float(y0), float(y1), float(y2))
         self._y_max = max(1.0, max_y * 1.2) if max_y > 0 else 1.0
         self._redraw()
         self._sync_entries()
 
+    KEYS = ("x0", "y0", "x1", "y1", "x2", "y2")
+
     def get_values(self):
-        return {
-            "x0": f"{self._points[0][0]:.6f}", "y0": f"{self._points[0][1]:.6f}",
-            "x1": f"{self._points[1][0]:.6f}", "y1": f"{self._points[1][1]:.6f}",
-            "x2": f"{self._points[2][0]:.6f}", "y2": f"{self._points[2][1]:.6f}",
-        }
+        """Return ((attr, formatted value), ...) in XML attribute order."""
+        return tuple(zip(self.KEYS, (f"{v:.6f}" for p in self._points for v in p)))
 
 
 PARAM_Y_LIMITS = {
@@ -287,24 +343,46 @@ class ParamBlock(ttk.LabelFrame):
 
     def __init__(self, parent, title="Parameter", **kw):
         super().__init__(parent, text=title, padding=4, **kw)
+        self._last_flat = None
+        self._xml_elem = None            # element _xml_refs was looked up from
+        self._xml_refs = (None, None)    # its (PhysicsCoeff, ThreePointCurve)
         self.physcoef = PhysCoefEditor(self, on_change=self._update_flat_mode)
         self.physcoef.pack(side=tk.LEFT, padx=(0, 8))
         self.curve = CurveEditor(self, y_limit=PARAM_Y_LIMITS.get(title))
         self.curve.pack(side=tk.LEFT)
 
     def _update_flat_mode(self):
-        self.curve.set_flat_mode(self.physcoef.is_all_zero())
+        # Only touch the curve when the mode flips; slider drags call this per event
+        flat = self.physcoef.is_all_zero()
+        if flat == self._last_flat:
+            return
+        self._last_flat = flat
+        self.curve.set_flat_mode(flat)
+
+    def _xml_children(self, element):
+        """Return element's (PhysicsCoeff, ThreePointCurve) in one pass, cached per element."""
+        if element is not self._xml_elem:
+            pc = tc = None
+            for child in element:
+                if child.tag == "PhysicsCoeff":
+                    if pc is None:
+                        pc = child
+                elif child.tag == "ThreePointCurve":
+                    if tc is None:
+                        tc = child
+            self._xml_elem = element
+            self._xml_refs = (pc, tc)
+        return self._xml_refs
 
     def load_from_xml(self, element):
         """Load from an XML element that has PhysicsCoeff and ThreePointCurve children."""
         if element is None:
             return
-        pc = element.find("PhysicsCoeff")
+        pc, tc = self._xml_children(element)
         if pc is not None:
             self.physcoef.set_values(
                 pc.get("RPM", "0"), pc.get("Throttle", "0"),
                 pc.get("PosTorque", "0"), pc.get("NegTorque", "0"))
-        tc = element.find("ThreePointCurve")
         if tc is not None:
             self.curve.set_values(
                 tc.get("x0", "0"), tc.get("y0", "0"),
@@ -316,13 +394,12 @@ class ParamBlock(ttk.LabelFrame):
         """Write values back to an XML element's PhysicsCoeff and ThreePointCurve."""
         if element is None:
             return
-        pc = element.find("PhysicsCoeff")
+        pc, tc = self._xml_children(element)
         if pc is not None:
-            for k, v in self.physcoef.get_values().items():
+            for k, v in self.physcoef.get_values():
                 pc.set(k, v)
-        tc = element.find("ThreePointCurve")
         if tc is not None:
-            for k, v in self.curve.get_values().items():
+            for k, v in self.curve.get_values():
                 tc.set(k, v)
 
 
@@ -335,7 +412,8 @@ class ScrollableFrame(ttk.Frame):
         self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
         self.interior = ttk.Frame(self.canvas)
 
-        self.interior.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
+        self._scrollregion = None
+        self.interior.bind("<Configure>", self._on_interior_configure)
         self.canvas_window = self.canvas.create_window((0, 0), window=self.interior, anchor="nw")
         self.canvas.configure(yscrollcommand=self.scrollbar.set)
 
@@ -343,18 +421,28 @@ class ScrollableFrame(ttk.Frame):
         self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         self.canvas.bind("<Configure>", self._on_canvas_resize)
-        # Mouse wheel scrolling
-        self.interior.bind("<Enter>", self._bind_mousewheel)
-        self.interior.bind("<Leave>", self._unbind_mousewheel)
+        # Mouse wheel scrolling - one global binding routed to the frame under the pointer
+        self.bind_all("<MouseWheel>", self._route_mousewheel)
+
+    def _on_interior_configure(self, event):
+        # The interior window sits at (0, 0), so its size is the scroll region
+        region = (0, 0, event.width, event.height)
+        if region != self._scrollregion:
+            self._scrollregion = region
+            self.canvas.configure(scrollregion=region)
 
     def _on_canvas_resize(self, event):
         self.canvas.itemconfig(self.canvas_window, width=event.width)
 
-    def _bind_mousewheel(self, event):
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-
-    def _unbind_mousewheel(self, event):
-        self.canvas.unbind_all("<MouseWheel>")
+    def _route_mousewheel(self, event):
+        try:
+            w = self.winfo_containing(event.x_root, event.y_root)
+        except KeyError:  # Tcl-only widget (e.g. a combobox popdown)
+            return
+        while w is not None and not isinstance(w, ScrollableFrame):
+            w = w.master
+        if w is not None:
+            w._on_mousewheel(event)
 
     def _on_mousewheel(self, event):
         self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
@@ -364,6 +452,11 @@ class ScrollableFrame(ttk.Frame):
 # HT file parsing (unchanged)
 # ============================================================
 
+_RE_PREFIX = re.compile(r'^(\d+R?[A-Z]{1,2}\d?)')
+_RE_PREFIX_SPLIT = re.compile(r'^(\d+)(R?)([A-Z]{1,2})(\d?)')
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_ht_filename(filename):
     if filename.endswith("_HT.xml.xml"):
         base = filename[:-len("_HT.xml.xml")]
@@ -383,7 +476,7 @@ def parse_ht_filename(filename):
         base_no_comp = base.rsplit("_Exh", 1)[0]
     else:
         return None
-    m = re.match(r'^(\d+R?[A-Z]{1,2}\d?)', base_no_comp)
+    m = _RE_PREFIX.match(base_no_comp)
     if m:
         prefix = m.group(1)
         name_part = base_no_comp[len(prefix):].lstrip("_")
@@ -392,7 +485,7 @@ def parse_ht_filename(filename):
         name_part = "NA"
     else:
         return None
-    rm = re.match(r'^(\d+)(R?)([A-Z]{1,2})(\d?)', prefix)
+    rm = _RE_PREFIX_SPLIT.match(prefix)
     if rm:
         cyl_key = "2R" if rm.group(2) == "R" else rm.group(1)
     elif prefix == "NA":
@@ -403,13 +496,171 @@ def parse_ht_filename(filename):
     return (prefix, display, comp_type, cyl_key, filename)
 
 
+def _list_xml_files(d):
+    """Return the names of the .xml files in d (empty if d does not exist)."""
+    try:
+        with os.scandir(d) as it:
+            return [e.name for e in it if e.name.endswith(".xml") and e.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+_RE_DIGITS = re.compile(r'(\d+)')
+
+
+def _natural_key(name):
+    """Sort key ordering digit runs numerically ("backup_2" before "backup_10")."""
+    return [int(part) if part.isdigit() else part.lower() for part in _RE_DIGITS.split(name)]
+
+
+def _walk_files(root):
+    """Yield (dirpath, file DirEntries) for every directory under root.
+
+    Same visiting order as os.walk (a directory's files before its subdirs,
+    symlinked dirs not followed, unreadable dirs skipped), minus the per-file
+    path joins.
+    """
+    stack = [root]
+    while stack:
+        dirpath = stack.pop()
+        files, subdirs = [], []
+        try:
+            with os.scandir(dirpath) as it:
+                for e in it:
+                    try:
+                        is_dir = e.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        files.append(e)
+                    elif not e.is_symlink():
+                        subdirs.append(e.path)
+        except OSError:
+            continue
+        yield dirpath, files
+        stack.extend(reversed(subdirs))
+
+
+def scan_for_tuning_files(scan_root):
+    """Walk scan_root for ET/HT XMLs and the main tuning ZIPs.
+
+    found_* hold the first path seen for every name outside the working
+    dirs; new_* is the subset not already in ET_DIR/HT_DIR.
+    """
+    found_et = {}  # filename -> source_path
+    found_ht = {}  # filename -> source_path
+    main_et_zip = None
+    main_ht_zip = None
+
+    # Names already in the working dirs; anything else found is a new DLC file
+    existing_et = set(_list_xml_files(ET_DIR))
+    existing_ht = set(_list_xml_files(HT_DIR))
+    new_et = {}
+    new_ht = {}
+
+    skip_et_dirs = {os.path.normcase(os.path.normpath(d)) for d in (ET_DIR, DLC_ET_DIR)}
+    skip_ht_dirs = {os.path.normcase(os.path.normpath(d)) for d in (HT_DIR, DLC_HT_DIR)}
+
+    for dirpath, files in _walk_files(scan_root):
+        norm_dir = os.path.normcase(os.path.normpath(dirpath))
+        scan_et = norm_dir not in skip_et_dirs
+        scan_ht = norm_dir not in skip_ht_dirs
+        for e in files:
+            fn = e.name
+            if fn == "enginetuning.zip":
+                if main_et_zip is None or "DVD1" in dirpath:
+                    main_et_zip = e.path
+            elif fn == "harmonictuning.zip":
+                if main_ht_zip is None or "DVD1" in dirpath:
+                    main_ht_zip = e.path
+            elif fn.endswith("_ET.xml"):
+                if scan_et and fn not in found_et:
+                    found_et[fn] = e.path
+                    if fn not in existing_et:
+                        new_et[fn] = e.path
+            elif fn.endswith("_HT.xml"):
+                if scan_ht and fn not in found_ht:
+                    found_ht[fn] = e.path
+                    if fn not in existing_ht:
+                        new_ht[fn] = e.path
+
+    return {"found_et": found_et, "found_ht": found_ht, "new_et": new_et, "new_ht": new_ht,
+            "main_et_zip": main_et_zip, "main_ht_zip": main_ht_zip}
+
+
+def copy_file(src, dest):
+    """Copy src to dest with its metadata, like shutil.copy2, for large files.
+
+    Uses os.copy_file_range (in-kernel, reflink capable) where the OS has it,
+    else IO_BUFFER_SIZE chunks instead of shutil's 64 KiB default.
+    """
+    if os.path.exists(dest) and os.path.samefile(src, dest):
+        raise shutil.SameFileError(f"{src!r} and {dest!r} are the same file")
+    with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+        copied = False
+        if hasattr(os, "copy_file_range"):
+            try:
+                # Ask for the whole file in one call so CoW file systems can clone it as
+                # a single range; keep going until EOF after a short count
+                fd_in, fd_out = fsrc.fileno(), fdst.fileno()
+                size = remaining = os.fstat(fd_in).st_size
+                total = 0
+                while True:
+                    n = os.copy_file_range(fd_in, fd_out, max(remaining, IO_BUFFER_SIZE))
+                    if not n:
+                        break
+                    total += n
+                    remaining -= n
+                # Some file system pairs return 0 up front instead of failing; as in
+                # shutil, 0 only means EOF once something was copied
+                copied = total > 0 or size == 0
+            except OSError:
+                # Not supported for this file system pair; start over buffered
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+        if not copied:
+            shutil.copyfileobj(fsrc, fdst, IO_BUFFER_SIZE)
+    shutil.copystat(src, dest)
+
+
+def needs_copy(src, dest):
+    """False if dest already looks like a copy of src (same size and mtime, as rsync checks)."""
+    try:
+        ds = os.stat(dest)
+    except FileNotFoundError:
+        return True
+    ss = os.stat(src)
+    return ss.st_size != ds.st_size or int(ss.st_mtime) != int(ds.st_mtime)
+
+
+def copy_files(copies, max_workers=8, progress=None):
+    """copy_file each (src, dest) pair on a thread pool; returns the count.
+
+    Destination dirs are created once up front. progress, if given, is called
+    on the calling thread with the number of copies finished so far. The first
+    copy error is re-raised once the copies already running finish.
+    """
+    for d in {os.path.dirname(dest) for _, dest in copies}:
+        os.makedirs(d, exist_ok=True)
+    if copies:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            done = 0
+            for fut in as_completed([pool.submit(copy_file, src, dest) for src, dest in copies]):
+                fut.result()
+                done += 1
+                if progress is not None:
+                    progress(done)
+    return len(copies)
+
+
 def load_ht_files():
     engine_files, intake_files, exhaust_files = [], [], []
     seen = set()
     for d in [HT_DIR, DLC_HT_DIR]:
-        if not os.path.isdir(d):
-            continue
-        for fn in sorted(os.listdir(d)):
+        names = _list_xml_files(d)
+        names.sort()
+        for fn in names:
             if fn in seen:
                 continue
             seen.add(fn)
@@ -427,18 +678,24 @@ def load_ht_files():
     return engine_files, intake_files, exhaust_files
 
 
+# Car filename -> full path, rebuilt by load_car_list() (ET_DIR wins over DLC)
+_ET_INDEX = {}
+
+
 def load_car_list():
-    files = set()
+    _ET_INDEX.clear()
     for d in [ET_DIR, DLC_ET_DIR]:
-        if os.path.isdir(d):
-            for f in os.listdir(d):
-                if f.endswith("_ET.xml"):
-                    files.add(f)
-    return sorted(files)
+        for f in _list_xml_files(d):
+            if f.endswith("_ET.xml"):
+                _ET_INDEX.setdefault(f, os.path.join(d, f))
+    return sorted(_ET_INDEX)
 
 
 def resolve_et_path(car_file):
     """Return the full path to an ET XML, checking ET_DIR first then DLC_ET_DIR."""
+    p = _ET_INDEX.get(car_file)
+    if p is not None:
+        return p
     p = os.path.join(ET_DIR, car_file)
     if os.path.isfile(p):
         return p
@@ -448,6 +705,92 @@ def resolve_et_path(car_file):
     return None
 
 
+# Top-level ET sections the tuner reads; anything else can be dropped when a
+# car file is only parsed for reading (e.g. as a clone source).
+ET_AUDIO_SECTIONS = frozenset({
+    "EngineSettings", "EngineAmbient", "EngineIntake", "Exhaust", "HarmonicTunings",
+    "FocusPEQ", "Distortion", "Compressor", "ShiftVolumeScalar", "TrashDSP",
+})
+
+
+def parse_et_sections(path, sections=ET_AUDIO_SECTIONS):
+    """Parse an ET XML keeping only the given top-level sections (read-only use).
+
+    Parsing stops as soon as every wanted section has been read; find() only
+    ever returns the first match, so later duplicates would be unused anyway.
+    """
+    root = None
+    depth = 0
+    remaining = set(sections)
+    with open(path, "rb") as f:
+        for event, elem in ET.iterparse(f, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = elem
+                depth += 1
+                continue
+            depth -= 1
+            if depth != 1:
+                continue
+            if elem.tag not in sections:
+                elem.clear()
+                root.remove(elem)
+            else:
+                remaining.discard(elem.tag)
+                if not remaining:
+                    break
+    return ET.ElementTree(root)
+
+
+# Nested elements the editor reads/writes, besides the top-level sections
+_ET_NESTED_PATHS = (
+    "EngineAmbient/Upgrade", "EngineIntake/Upgrade", "Exhaust/Upgrade",
+    "HarmonicTunings/EmissionGroup0", "HarmonicTunings/EmissionGroup1", "HarmonicTunings/EmissionGroup2",
+)
+
+
+def _index_children(elem):
+    """Map each child tag of elem (first occurrence, like find) to its element; {} for None."""
+    index = {}
+    if elem is not None:
+        for child in elem:
+            index.setdefault(child.tag, child)
+    return index
+
+
+def et_element_index(root):
+    """Map each top-level tag (first occurrence) and each _ET_NESTED_PATHS path to its element.
+
+    Missing top-level tags are absent; missing nested paths map to None.
+    """
+    index = _index_children(root)
+    for path in _ET_NESTED_PATHS:
+        parent, _, tag = path.partition("/")
+        section = index.get(parent)
+        index[path] = section.find(tag) if section is not None else None
+    return index
+
+
+# (XML attribute or child tag, widget key) tables for emission group / global effects load and save
+PEQ_PARAMS = {
+    prefix: (("Gain", f"{prefix}_gain"), ("CenterFrequency", f"{prefix}_freq"), ("Bandwidth", f"{prefix}_bw"))
+    for prefix in ("peq", "posload", "negload", "fpeq")
+}
+EXP_SETTINGS = tuple((attr, f"exp_{attr.lower()}") for attr in ("AttackTime", "HoldTime", "ReleaseTime"))
+COMP_SETTINGS = tuple((attr, f"comp_{attr.lower()}")
+                      for attr in ("Threshold", "Attack", "Release", "GainMakeup"))
+SVS_SETTINGS = tuple((attr, f"svs_{attr.lower()}")
+                     for attr in ("ShiftVolBoostUpPct", "ShiftVolBoostUpTime",
+                                  "ShiftVolBoostDownPct", "ShiftVolBoostDownTime"))
+# Per TrashDSP band: (band tag, effecttype key, ((scalar, attribute key, ParamBlock key), ...))
+TRASH_BANDS = tuple(
+    (f"Band{n}", f"trash_b{n}_effecttype",
+     tuple((scalar, f"trash_b{n}_{scalar}_attr", f"trash_b{n}_{scalar}")
+           for scalar in ("inputgain", "overdrive", "mix", "outputgain")))
+    for n in range(1, 4)
+)
+
+@functools.lru_cache(maxsize=2048)
 def ht_display_name(filename):
     if not filename or filename in ("NA.xml", ""):
         return filename or "(none)"
@@ -461,42 +804,60 @@ def ht_display_name(filename):
 # ZIP functions (unchanged)
 # ============================================================
 
+_SIG = struct.Struct("<I")
+_LFH = struct.Struct("<IHHHHHIIIHH")          # local file header (30 bytes)
+_CDH = struct.Struct("<IHHHHHHIIIHHHHHII")    # central directory header (46 bytes)
+_EOCD = struct.Struct("<IHHHHIIH")            # end of central directory (22 bytes)
+_LFH_SIG, _CDH_SIG, _EOCD_SIG = 0x04034B50, 0x02014B50, 0x06054B50
+_DD_SIG, _DD_SIZE = 0x08074B50, 16            # signed data descriptor (flag bit 3)
+_LFH_MAGIC, _CDH_MAGIC = b"PK\x03\x04", b"PK\x01\x02"
+
+
+def _find_zip_signature(data, start, limit, magics):
+    """Return the first offset < limit where one of magics starts, else limit."""
+    hits = [p for p in (data.find(m, start, limit + 3) for m in magics) if p >= 0]
+    return min(hits) if hits else limit
+
+
 def rebuild_zip_central_directory(zip_path):
-    with open(zip_path, "rb") as f:
-        data = bytearray(f.read())
-    local_entries = []
-    offset = 0
-    while offset < len(data) - 30:
-        sig = struct.unpack_from("<I", data, offset)[0]
-        if sig == 0x04034B50:
-            fields = struct.unpack_from("<HHHHHIIIHH", data, offset + 4)
-            ver, flags, method, modtime, moddate, crc, comp_sz, uncomp_sz, fn_len, extra_len = fields
-            fn = data[offset + 30:offset + 30 + fn_len].decode("ascii", errors="replace")
-            local_entries.append({
-                "local_header_offset": offset, "name": fn, "ver": ver, "flags": flags,
-                "method": method, "modtime": modtime, "moddate": moddate,
-                "crc": crc, "comp_sz": comp_sz, "uncomp_sz": uncomp_sz,
-                "fn_len": fn_len, "extra_len": extra_len,
-            })
-            offset += 30 + fn_len + extra_len + comp_sz
-        elif sig == 0x02014B50:
-            break
-        else:
-            offset += 1
-    local_data_end = offset
-    cd_entries = bytearray()
-    for e in local_entries:
-        fn_bytes = e["name"].encode("ascii")
-        entry = struct.pack("<IHHHHHHIIIHHHHHII", 0x02014B50,
-                            e["ver"], e["ver"], e["flags"], e["method"],
-                            e["modtime"], e["moddate"], e["crc"], e["comp_sz"], e["uncomp_sz"],
-                            e["fn_len"], 0, 0, 0, 0, 0, e["local_header_offset"])
-        cd_entries += entry + fn_bytes
-    eocd = struct.pack("<IHHHHIIH", 0x06054B50, 0, 0,
-                       len(local_entries), len(local_entries), len(cd_entries), local_data_end, 0)
-    new_zip = bytes(data[:local_data_end]) + bytes(cd_entries) + bytes(eocd)
-    with open(zip_path, "wb") as f:
-        f.write(new_zip)
+    """Rewrite the CD + EOCD after the local entries, leaving the entries in place.
+
+    zipfile can't do this: entries are XMemCompress (method 21), which it can
+    neither decode nor copy through raw, so the CD is rebuilt by hand.
+    """
+    local_entries = []  # (local header offset, _LFH fields, raw name bytes)
+    with open(zip_path, "r+b") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            size = len(data)
+            offset = 0
+            limit = size - 30
+            while offset < limit:
+                sig = _SIG.unpack_from(data, offset)[0]
+                if sig == _LFH_SIG:
+                    fields = _LFH.unpack_from(data, offset)
+                    comp_sz, fn_len, extra_len = fields[7], fields[9], fields[10]
+                    fn_bytes = data[offset + 30:offset + 30 + fn_len]
+                    local_entries.append((offset, fields, fn_bytes))
+                    offset += 30 + fn_len + extra_len + comp_sz
+                elif sig == _CDH_SIG:
+                    break
+                elif sig == _DD_SIG:
+                    offset += _DD_SIZE
+                else:
+                    offset = _find_zip_signature(data, offset + 1, limit, (_LFH_MAGIC, _CDH_MAGIC))
+        local_data_end = offset
+        cd_entries = bytearray()
+        for lh_offset, fields, fn_bytes in local_entries:
+            _, ver, flags, method, modtime, moddate, crc, comp_sz, uncomp_sz, fn_len, _ = fields
+            cd_entries += _CDH.pack(_CDH_SIG, ver, ver, flags, method, modtime, moddate,
+                                    crc, comp_sz, uncomp_sz, fn_len, 0, 0, 0, 0, 0, lh_offset)
+            cd_entries += fn_bytes
+        eocd = _EOCD.pack(_EOCD_SIG, 0, 0,
+                          len(local_entries), len(local_entries), len(cd_entries), local_data_end, 0)
+        f.seek(min(local_data_end, size))
+        f.write(cd_entries)
+        f.write(eocd)
+        f.truncate()
     return len(local_entries)
 
 
@@ -509,19 +870,19 @@ def verify_zip(zip_path):
     cd_offset = struct.unpack_from("<I", data, eocd_pos + 16)[0]
     if cd_offset >= len(data):
         return False, f"CD offset 0x{cd_offset:08x} beyond file size"
-    if data[cd_offset:cd_offset + 4] != b"PK\x01\x02":
+    if data[cd_offset:cd_offset + 4] != _CDH_MAGIC:
         return False, f"Invalid CD signature at 0x{cd_offset:08x}"
     entry_count = struct.unpack_from("<H", data, eocd_pos + 10)[0]
     local_count = 0
     offset = 0
     while offset < cd_offset:
-        sig = struct.unpack_from("<I", data, offset)[0]
-        if sig == 0x04034B50:
+        sig = _SIG.unpack_from(data, offset)[0]
+        if sig == _LFH_SIG:
             local_count += 1
-            fields = struct.unpack_from("<HHHHHIIIHH", data, offset + 4)
-            offset += 30 + fields[8] + fields[9] + fields[6]
+            fields = _LFH.unpack_from(data, offset)
+            offset += 30 + fields[9] + fields[10] + fields[7]
         else:
-            offset += 1
+            offset = _find_zip_signature(data, offset + 1, cd_offset, (_LFH_MAGIC,))
     if local_count != entry_count:
         return False, f"Local headers ({local_count}) != CD entries ({entry_count})"
     return True, f"Valid: {entry_count} files, CD at 0x{cd_offset:08x}"
@@ -533,32 +894,15 @@ def verify_zip(zip_path):
 
 def write_xml_file(tree, path):
     """Write an ElementTree to file with 2-space indentation."""
-    _indent_xml(tree.getroot())
-    tree.write(path, encoding="unicode", xml_declaration=False)
-    # Ensure trailing newline
-    with open(path, "a", encoding="utf-8") as f:
+    ET.indent(tree, space="  ")
+    tree.getroot().tail = "\n"
+    # Same text-mode settings ElementTree uses for a path, in one open/flush
+    with open(path, "w", encoding="utf-8", errors="xmlcharrefreplace", buffering=IO_BUFFER_SIZE) as f:
+        tree.write(f, encoding="unicode", xml_declaration=False)
+        # Ensure trailing newline
         f.write("\n")
 
 
-def _indent_xml(elem, level=0):
-    """Add pretty-print indentation to an ElementTree."""
-    indent = "\n" + "  " * level
-    if len(elem):
-        if not elem.text or not elem.text.strip():
-            elem.text = indent + "  "
-        if not elem.tail or not elem.tail.strip():
-            elem.tail = indent
-        for child in elem:
-            _indent_xml(child, level + 1)
-        if not child.tail or not child.tail.strip():
-            child.tail = indent
-    else:
-        if level and (not elem.tail or not elem.tail.strip()):
-            elem.tail = indent
-    if level == 0:
-        elem.tail = "\n"
-
-
 # ============================================================
 # Main Application
 # ============================================================
@@ -576,7 +920,8 @@ class FM4CarAudioTuner:
 
         self.car_files = load_car_list()
         self.car_display = [f.replace("_ET.xml", "") for f in self.car_files]
-        self.engine_ht, self.intake_ht, self.exhaust_ht = load_ht_files()
+        self._car_display_lower = tuple(map(str.lower, self.car_display))
+        self._load_ht_lists()
         self.current_car_file = None
         self.current_tree = None
 
@@ -584,21 +929,34 @@ class FM4CarAudioTuner:
         self.clone_car_file = None       # Currently selected clone source
         self.clone_car_display = None    # Display name of clone source
         self._pre_clone_tree = None      # Snapshot of original XML before cloning
+        self._tree_cache = collections.OrderedDict()  # (path, mtime_ns, size) -> pristine parsed tree
+        self._et_index_root = None       # Root the cached element index was built from
+        self._et_index = {}
+        self._child_indexes = {}         # element -> _index_children map, for that root
 
-        self._undo_stack = []
-        self._redo_stack = []
+        self._undo_stack = collections.deque(maxlen=UNDO_LEVELS)  # oldest entries drop off the left
+        self._redo_stack = collections.deque(maxlen=UNDO_LEVELS)
         self._last_state = None
+        self._saved_state = None         # _capture_state() when current_tree last matched the widgets
+        self._value_cache = {}           # _capture_state key -> current value (tk vars and ParamBlocks)
+        self._cached_vars = {}           # _capture_state key -> tk var feeding it
+        self._param_blocks = {}          # _capture_state key prefix -> ParamBlock, for built tabs
+        self._block_revs = {}            # that prefix -> editor revisions _value_cache reflects
+        self._edit_pending = False       # _value_cache changed since _last_state was taken
         self._restoring = False
         self._edit_timer = None
+        self._search_timer = None
+        self._clone_search_timer = None
+        self._find_job = None            # (worker thread, job dict) while Find Files runs
+        self._export_job = None          # (worker thread, job dict) while Export runs
+        self._backup_mapping_cache = (None, None)  # ((path, mtime_ns, size), parsed mapping.json)
+        self._progress_shown = 0.0       # time.monotonic() of the last copy progress redraw
 
         self._build_ui()
         self._update_mapping_indicator()
 
         self.root.bind_all("<Control-z>", self._on_undo)
         self.root.bind_all("<Control-y>", self._on_redo)
-        self.root.bind_all("<ButtonRelease-1>", self._on_possible_edit)
-        self.root.bind_all("<Return>", self._on_possible_edit)
-        self.root.bind_all("<FocusOut>", self._on_possible_edit)
 
     # ---- Top selector panel ----
 
@@ -626,7 +984,10 @@ class FM4CarAudioTuner:
 
         ttk.Label(top, text="Redline:", style="H.TLabel").pack(side=tk.LEFT, padx=(12, 0))
         self.redline_var = tk.StringVar()
-        ttk.Entry(top, textvariable=self.redline_var, width=8).pack(side=tk.LEFT, padx=4)
+        self._cache_var("redline", self.redline_var)
+        redline_entry = ttk.Entry(top, textvariable=self.redline_var, width=8)
+        redline_entry.pack(side=tk.LEFT, padx=4)
+        self._track_edits(redline_entry)
 
         # Output override path (packed from right)
         ttk.Button(top, text="...", width=3, command=self._browse_output).pack(side=tk.RIGHT)
@@ -643,7 +1004,8 @@ class FM4CarAudioTuner:
         self.mapping_label.pack(side=tk.LEFT, padx=(2, 0))
 
         # Find Files button
-        ttk.Button(top, text="Find Files", command=self._on_find_files).pack(side=tk.RIGHT, padx=(4, 0))
+        self.find_btn = ttk.Button(top, text="Find Files", command=self._on_find_files)
+        self.find_btn.pack(side=tk.RIGHT, padx=(4, 0))
 
         # === Car list + Clone Audio split area ===
         list_area = ttk.Frame(main)
@@ -674,33 +1036,109 @@ class FM4CarAudioTuner:
             combo.pack(side=tk.LEFT, padx=4)
             setattr(self, f"{attr_name}_var", var)
             setattr(self, f"{attr_name}_combo", combo)
+            combo.bind("<<ComboboxSelected>>", self._on_possible_edit, add="+")
 
+        for key, var in [("engine", self.engine_var), ("intake_sel", self.intake_var),
+                         ("exhaust_sel", self.exhaust_var)]:
+            self._cache_var(key, var)
+
+        # (_ht_filtered key, combo) pairs walked by _update_ht_dropdowns
+        self._ht_slots = (("engine", self.engine_combo), ("intake", self.intake_combo),
+                          ("exhaust", self.exhaust_combo))
         self._update_ht_dropdowns()
 
         # === Tabs ===
         self.notebook = ttk.Notebook(main)
         self.notebook.pack(fill=tk.BOTH, expand=True, pady=(4, 4))
 
-        self.intake_tab = self._build_component_tab("Intake", has_exhaust_extras=False)
-        self.engine_tab = self._build_component_tab("Engine", has_exhaust_extras=False)
-        self.exhaust_tab = self._build_component_tab("Exhaust", has_exhaust_extras=True)
-        self.global_tab = self._build_global_tab()
-
-        self.notebook.add(self.intake_tab["frame"], text="Intake")
-        self.notebook.add(self.engine_tab["frame"], text="Engine")
-        self.notebook.add(self.exhaust_tab["frame"], text="Exhaust")
-        self.notebook.add(self.global_tab["frame"], text="Global Effects")
+        # Tab contents are built the first time a tab is shown (or a car is
+        # loaded); until then each page is an empty placeholder frame.
+        self._tab_builders = {
+            "intake_tab": ("Intake", lambda: self._build_component_tab("Intake", has_exhaust_extras=False)),
+            "engine_tab": ("Engine", lambda: self._build_component_tab("Engine", has_exhaust_extras=False)),
+            "exhaust_tab": ("Exhaust", lambda: self._build_component_tab("Exhaust", has_exhaust_extras=True)),
+            "global_tab": ("Global Effects", self._build_global_tab),
+        }
+        self._tab_placeholders = {}  # placeholder path -> (tab attr, placeholder)
+        for attr, (text, _) in self._tab_builders.items():
+            placeholder = ttk.Frame(self.notebook)
+            self.notebook.add(placeholder, text=text)
+            self._tab_placeholders[str(placeholder)] = (attr, placeholder)
+            setattr(self, attr, None)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_activated)
 
         # === Bottom buttons ===
         bottom = ttk.Frame(main)
         bottom.pack(fill=tk.X)
-        ttk.Button(bottom, text="Save", command=self._on_save).pack(side=tk.LEFT, padx=(0, 8))
-        ttk.Button(bottom, text="Export", command=self._on_export).pack(side=tk.LEFT, padx=(0, 8))
-        ttk.Button(bottom, text="Backup", command=self._on_backup).pack(side=tk.LEFT, padx=(0, 4))
-        ttk.Button(bottom, text="Restore Backup", command=self._on_restore_backup).pack(side=tk.LEFT)
+        self.save_btn = ttk.Button(bottom, text="Save", command=self._on_save)
+        self.save_btn.pack(side=tk.LEFT, padx=(0, 8))
+        self.export_btn = ttk.Button(bottom, text="Export", command=self._on_export)
+        self.export_btn.pack(side=tk.LEFT, padx=(0, 8))
+        self.backup_btn = ttk.Button(bottom, text="Backup", command=self._on_backup)
+        self.backup_btn.pack(side=tk.LEFT, padx=(0, 4))
+        self.restore_btn = ttk.Button(bottom, text="Restore Backup", command=self._on_restore_backup)
+        self.restore_btn.pack(side=tk.LEFT)
         self.status_var = tk.StringVar(value="Ready")
         ttk.Label(bottom, textvariable=self.status_var, foreground="gray").pack(side=tk.RIGHT)
 
+    # ---- Lazy tab construction ----
+
+    # Tab attribute -> key prefix used by _capture_state/_restore_state
+    _TAB_STATE_PREFIX = {"intake_tab": "int", "engine_tab": "eng", "exhaust_tab": "exh", "global_tab": "g"}
+
+    def _build_tab(self, key):
+        attr, placeholder = self._tab_placeholders.pop(key)
+        text, builder = self._tab_builders[attr]
+        widgets = builder()
+        self._track_edits(widgets["frame"])
+        prefix = self._TAB_STATE_PREFIX[attr]
+        for name, widget in widgets.items():
+            if isinstance(widget, (tk.IntVar, tk.StringVar)):
+                self._cache_var(f"{prefix}.{name}", widget)
+            elif isinstance(widget, ParamBlock):
+                self._param_blocks[f"{prefix}.{name}"] = widget
+        selected = self.notebook.select() == key
+        self.notebook.insert(placeholder, widgets["frame"], text=text)
+        self.notebook.forget(placeholder)
+        placeholder.destroy()
+        if selected:
+            self.notebook.select(widgets["frame"])
+        setattr(self, attr, widgets)
+
+    def _on_tab_activated(self, event=None):
+        key = self.notebook.select()
+        if key in self._tab_placeholders:
+            self._build_tab(key)
+
+    def _cache_var(self, key, var):
+        """Keep _value_cache[key] equal to str(var.get()) via a write trace."""
+        self._cached_vars[key] = var
+        self._set_cached(key, str(var.get()))
+        var.trace_add("write", lambda *_: self._on_var_write(key, var))
+
+    def _on_var_write(self, key, var):
+        # Checkbox and combo changes land after their click/select events, so
+        # the write itself schedules the undo check; the event bindings in
+        # _track_edits remain for ParamBlock editors
+        self._set_cached(key, str(var.get()))
+        if self._edit_pending and not self._restoring and self.current_tree is not None:
+            self._schedule_undo_check()
+
+    def _track_edits(self, widget):
+        """Bind the undo edit check on widget and every widget inside it."""
+        stack = [widget]
+        while stack:
+            w = stack.pop()
+            if not isinstance(w, ttk.Scrollbar):
+                for seq in ("<ButtonRelease-1>", "<Return>", "<FocusOut>"):
+                    w.bind(seq, self._on_possible_edit, add="+")
+            stack.extend(w.winfo_children())
+
+    def _ensure_tabs_built(self):
+        """Build any tabs not yet shown; loading a car writes into every tab."""
+        for key in list(self._tab_placeholders):
+            self._build_tab(key)
+
     # ---- Component tab builder ----
 
     def _build_component_tab(self, name, has_exhaust_extras=False):
@@ -877,6 +1315,7 @@ class FM4CarAudioTuner:
             et_combo = ttk.Combobox(band_top, textvariable=et_var,
                                     values=["1.000000", "2.000000", "3.000000"], state="readonly", width=10)
             et_combo.pack(side=tk.LEFT, padx=4)
+            et_combo.bind("<<ComboboxSelected>>", self._on_possible_edit, add="+")
             w[f"trash_b{band_num}_effecttype"] = et_var
 
             # Scalar attrs shown inline
@@ -910,10 +1349,10 @@ class FM4CarAudioTuner:
     def _load_file_mapping(self):
         if os.path.isfile(FILE_MAPPING_PATH):
             try:
-                with open(FILE_MAPPING_PATH, "r") as f:
-                    self.file_mapping = json.load(f)
+                with open(FILE_MAPPING_PATH, "rb") as f:
+                    self.file_mapping = json.loads(f.read())
                 self.mapping_loaded = True
-            except (json.JSONDecodeError, OSError):
+            except (ValueError, OSError):
                 self.file_mapping = {}
                 self.mapping_loaded = False
         else:
@@ -921,8 +1360,13 @@ class FM4CarAudioTuner:
             self.mapping_loaded = False
 
     def _save_file_mapping(self):
-        with open(FILE_MAPPING_PATH, "w") as f:
-            json.dump(self.file_mapping, f, indent=2)
+        # Encode in one go (json.dump with indent issues a write per token), then
+        # swap the file in atomically so an interrupted save can't corrupt it
+        text = json.dumps(self.file_mapping, indent=2)
+        tmp_path = FILE_MAPPING_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, FILE_MAPPING_PATH)
 
     def _update_mapping_indicator(self):
         if self.mapping_loaded and self.file_mapping:
@@ -931,6 +1375,8 @@ class FM4CarAudioTuner:
             self.mapping_indicator.configure(fg="gray")
 
     def _on_find_files(self):
+        if self._export_job is not None or self._find_job is not None:
+            return  # Buttons are greyed out; this covers any other way in
         scan_root = filedialog.askdirectory(
             initialdir=DEFAULT_SCAN_ROOT,
             title="Select root directory to scan for tuning files")
@@ -938,62 +1384,47 @@ class FM4CarAudioTuner:
             return
 
         self.status_var.set("Scanning for files...")
-        self.root.update()
-
-        found_et = {}  # filename -> source_path
-        found_ht = {}  # filename -> source_path
-        main_et_zip = None
-        main_ht_zip = None
-
-        norm_et = os.path.normpath(ET_DIR)
-        norm_dlc_et = os.path.normpath(DLC_ET_DIR)
-        norm_ht = os.path.normpath(HT_DIR)
-        norm_dlc_ht = os.path.normpath(DLC_HT_DIR)
-
-        for dirpath, dirnames, filenames in os.walk(scan_root):
-            norm_dir = os.path.normpath(dirpath)
-            for fn in filenames:
-                if fn == "enginetuning.zip":
-                    full = os.path.join(dirpath, fn)
-                    if main_et_zip is None or "DVD1" in dirpath:
-                        main_et_zip = full
-                elif fn == "harmonictuning.zip":
-                    full = os.path.join(dirpath, fn)
-                    if main_ht_zip is None or "DVD1" in dirpath:
-                        main_ht_zip = full
-                elif fn.endswith("_ET.xml"):
-                    if norm_dir in (norm_et, norm_dlc_et):
-                        continue
-                    if fn not in found_et:
-                        found_et[fn] = os.path.join(dirpath, fn)
-                elif fn.endswith("_HT.xml"):
-                    if norm_dir in (norm_ht, norm_dlc_ht):
-                        continue
-                    if fn not in found_ht:
-                        found_ht[fn] = os.path.join(dirpath, fn)
-
-        # Separate new DLC files from files already in ET_DIR
-        existing_et = set(os.listdir(ET_DIR)) if os.path.isdir(ET_DIR) else set()
-        new_et = {fn: p for fn, p in found_et.items() if fn not in existing_et}
-
-        existing_ht = set(os.listdir(HT_DIR)) if os.path.isdir(HT_DIR) else set()
-        new_ht = {fn: p for fn, p in found_ht.items() if fn not in existing_ht}
-
-        # Create DLC working directories and copy files
-        os.makedirs(DLC_ET_DIR, exist_ok=True)
-        os.makedirs(DLC_HT_DIR, exist_ok=True)
-
-        et_copied = 0
-        for fn, source in new_et.items():
-            dest = os.path.join(DLC_ET_DIR, fn)
-            shutil.copy2(source, dest)
-            et_copied += 1
-
-        ht_copied = 0
-        for fn, source in new_ht.items():
-            dest = os.path.join(DLC_HT_DIR, fn)
-            shutil.copy2(source, dest)
-            ht_copied += 1
+        job = {"scan_root": scan_root, "copied": 0, "to_copy": 0,
+               "result": None, "error": None}
+        worker = threading.Thread(target=self._find_files_worker, args=(job,), daemon=True)
+        self._find_job = (worker, job)
+        self._set_file_ops_enabled(False)
+        worker.start()
+        self.root.after(100, self._poll_find_files)
+
+    def _find_files_worker(self, job):
+        """Scan and copy off the Tk thread; only touches the job dict."""
+        try:
+            found = scan_for_tuning_files(job["scan_root"])
+            copies = [(source, os.path.join(DLC_ET_DIR, fn)) for fn, source in found["new_et"].items()]
+            copies += [(source, os.path.join(DLC_HT_DIR, fn)) for fn, source in found["new_ht"].items()]
+            job["to_copy"] = len(copies)
+            # Copies are I/O bound (often DVD or network sources), so overlap them
+            copy_files(copies, progress=lambda done: job.__setitem__("copied", done))
+            job["result"] = found
+        except Exception as e:
+            job["error"] = e
+
+    def _poll_find_files(self):
+        worker, job = self._find_job
+        if worker.is_alive():
+            if job["to_copy"]:
+                self.status_var.set(f"Copying files... {job['copied']}/{job['to_copy']}")
+            self.root.after(100, self._poll_find_files)
+            return
+        self._find_job = None
+        self._set_file_ops_enabled(True)
+        if job["error"] is not None:
+            self.status_var.set("Find Files failed.")
+            raise job["error"]
+        self._finish_find_files(job["scan_root"], job["result"])
+
+    def _finish_find_files(self, scan_root, found):
+        found_et = found["found_et"]
+        new_et, new_ht = found["new_et"], found["new_ht"]
+        main_et_zip, main_ht_zip = found["main_et_zip"], found["main_ht_zip"]
+        et_copied = len(new_et)
+        ht_copied = len(new_ht)
 
         # Build mapping
         mapping = {
@@ -1005,21 +1436,14 @@ class FM4CarAudioTuner:
             "ht_files": {},
         }
 
-        # Map DLC ET files
-        for fn, source in new_et.items():
+        # Map every ET file found: new DLC files plus loose overrides of files
+        # already in ET_DIR (found_et holds exactly those two kinds)
+        for fn, source in found_et.items():
             mapping["et_files"][fn] = {
                 "source_path": source,
                 "output_dir": os.path.dirname(source),
             }
 
-        # Map loose override ET files (exist in both ET_DIR and found locations)
-        for fn, source in found_et.items():
-            if fn in existing_et and fn not in new_et:
-                mapping["et_files"][fn] = {
-                    "source_path": source,
-                    "output_dir": os.path.dirname(source),
-                }
-
         # Map DLC HT files
         for fn, source in new_ht.items():
             mapping["ht_files"][fn] = {
@@ -1034,7 +1458,8 @@ class FM4CarAudioTuner:
         # Refresh car list and HT dropdowns
         self.car_files = load_car_list()
         self.car_display = [f.replace("_ET.xml", "") for f in self.car_files]
-        self.engine_ht, self.intake_ht, self.exhaust_ht = load_ht_files()
+        self._car_display_lower = tuple(map(str.lower, self.car_display))
+        self._load_ht_lists()
         self._populate_car_list(self.search_var.get())
         self._update_ht_dropdowns()
 
@@ -1053,16 +1478,68 @@ class FM4CarAudioTuner:
     # ---- Car list ----
 
     def _populate_car_list(self, filter_text):
-        self.car_listbox.delete(0, tk.END)
         ft = filter_text.lower()
-        self._filtered_indices = []
-        for i, name in enumerate(self.car_display):
-            if ft in name.lower():
-                self.car_listbox.insert(tk.END, name)
-                self._filtered_indices.append(i)
+        self._car_filter = ft
+        self._filtered_indices = [i for i, name_lc in enumerate(self._car_display_lower) if ft in name_lc]
+        self._show_car_rows()
+
+    def _show_car_rows(self):
+        """Refill the car list with the first page of matches."""
+        self.car_listbox.delete(0, tk.END)
+        self._car_rows_shown = 0
+        self._add_car_rows(CAR_LIST_PAGE)
+
+    def _add_car_rows(self, count):
+        """Append up to count more matches, then a "... N more" tail row if any remain."""
+        lb = self.car_listbox
+        shown = self._car_rows_shown
+        if lb.size() > shown:
+            lb.delete(shown, tk.END)  # old tail row
+        page = self._filtered_indices[shown:shown + count]
+        if page:
+            lb.insert(tk.END, *[self.car_display[i] for i in page])
+        self._car_rows_shown = shown + len(page)
+        remaining = len(self._filtered_indices) - self._car_rows_shown
+        if remaining:
+            lb.insert(tk.END, f"... {remaining} more \u2014 click to show")
+            lb.itemconfigure(tk.END, foreground="gray")
+
+    def _narrow_listbox(self, listbox, shown, ft):
+        """Delete rows that no longer contain ft; returns the surviving car indices.
+
+        Only valid when ft contains the filter the rows were built with, so the
+        new matches are a subset of the rows already shown.
+        """
+        lower = self._car_display_lower
+        keep = [ft in lower[i] for i in shown]
+        pos = len(shown)
+        while pos > 0:
+            pos -= 1
+            if keep[pos]:
+                continue
+            end = pos
+            while pos > 0 and not keep[pos - 1]:
+                pos -= 1
+            listbox.delete(pos, end)
+        return [i for i, k in zip(shown, keep) if k]
 
     def _on_search_changed(self, *args):
-        self._populate_car_list(self.search_var.get())
+        # Debounce: filter once per typing burst
+        if self._search_timer:
+            self.root.after_cancel(self._search_timer)
+        self._search_timer = self.root.after(120, self._apply_search)
+
+    def _apply_search(self):
+        self._search_timer = None
+        ft = self.search_var.get().lower()
+        if self._car_filter in ft:
+            # Only the previous matches can still match
+            lower = self._car_display_lower
+            self._filtered_indices = [i for i in self._filtered_indices if ft in lower[i]]
+            self._car_filter = ft
+            self._show_car_rows()
+        else:
+            self._populate_car_list(ft)
 
     # ---- Clone Audio panel ----
 
@@ -1097,14 +1574,25 @@ class FM4CarAudioTuner:
     def _populate_clone_list(self, filter_text):
         self.clone_listbox.delete(0, tk.END)
         ft = filter_text.lower()
-        self._clone_filtered_indices = []
-        for i, name in enumerate(self.car_display):
-            if ft in name.lower():
-                self.clone_listbox.insert(tk.END, name)
-                self._clone_filtered_indices.append(i)
+        self._clone_filter = ft
+        self._clone_filtered_indices = [i for i, name_lc in enumerate(self._car_display_lower) if ft in name_lc]
+        if self._clone_filtered_indices:
+            self.clone_listbox.insert(tk.END, *[self.car_display[i] for i in self._clone_filtered_indices])
 
     def _on_clone_search_changed(self, *args):
-        self._populate_clone_list(self.clone_search_var.get())
+        if self._clone_search_timer:
+            self.root.after_cancel(self._clone_search_timer)
+        self._clone_search_timer = self.root.after(120, self._apply_clone_search)
+
+    def _apply_clone_search(self):
+        self._clone_search_timer = None
+        ft = self.clone_search_var.get().lower()
+        if self._clone_filter in ft:
+            self._clone_filtered_indices = self._narrow_listbox(
+                self.clone_listbox, self._clone_filtered_indices, ft)
+            self._clone_filter = ft
+        else:
+            self._populate_clone_list(ft)
 
     def _on_clone_checkbox_changed(self):
         if not self.clone_enabled.get():
@@ -1118,6 +1606,7 @@ class FM4CarAudioTuner:
                 path = resolve_et_path(self.current_car_file)
                 if path:
                     write_xml_file(self.current_tree, path)
+                    self._drop_cached_trees(path)
 
                 self._load_emission_group(root, "EmissionGroup0", self.intake_tab)
                 self._load_emission_group(root, "EmissionGroup1", self.engine_tab)
@@ -1126,19 +1615,11 @@ class FM4CarAudioTuner:
                 self._load_global_effects(root)
 
                 # Restore redline and component selectors from original
-                settings = root.find("EngineSettings")
-                self.redline_var.set(settings.get("audio_rpm_redline", "") if settings is not None else "")
-                el = root.find("EngineAmbient/Upgrade")
-                self._select_ht_combo(self.engine_combo, self.engine_var,
-                                      el.get("L0", "") if el is not None else "", self.engine_ht)
-                el = root.find("EngineIntake/Upgrade")
-                self._select_ht_combo(self.intake_combo, self.intake_var,
-                                      el.get("L3", "") if el is not None else "", self.intake_ht)
-                el = root.find("Exhaust/Upgrade")
-                self._select_ht_combo(self.exhaust_combo, self.exhaust_var,
-                                      el.get("L3", "") if el is not None else "", self.exhaust_ht)
+                self._apply_root_to_selectors(root)
+                self._saved_state = self._capture_state()
 
                 self.status_var.set(f"Clone disabled - restored: {self.current_car_file.replace('_ET.xml', '')}")
+                self._on_possible_edit()
 
             self.clone_car_file = None
             self.clone_car_display = None
@@ -1165,8 +1646,7 @@ class FM4CarAudioTuner:
             if clone_path is None:
                 messagebox.showerror("Error", f"Cannot find clone source: {clone_file}")
                 return
-            clone_tree = ET.parse(clone_path)
-            clone_root = clone_tree.getroot()
+            clone_root = self._read_car_root(clone_path)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to parse clone source {clone_file}:\n{e}")
             return
@@ -1180,25 +1660,14 @@ class FM4CarAudioTuner:
         self.clone_car_display = clone_display
 
         # Load clone car's data into UI widgets (without changing current_tree)
+        self._ensure_tabs_built()
         self._load_emission_group(clone_root, "EmissionGroup0", self.intake_tab)
         self._load_emission_group(clone_root, "EmissionGroup1", self.engine_tab)
         self._load_emission_group(clone_root, "EmissionGroup2", self.exhaust_tab)
         self._load_global_effects(clone_root)
 
-        # Update redline from clone
-        settings = clone_root.find("EngineSettings")
-        self.redline_var.set(settings.get("audio_rpm_redline", "") if settings is not None else "")
-
-        # Update component selectors from clone
-        el = clone_root.find("EngineAmbient/Upgrade")
-        self._select_ht_combo(self.engine_combo, self.engine_var,
-                              el.get("L0", "") if el is not None else "", self.engine_ht)
-        el = clone_root.find("EngineIntake/Upgrade")
-        self._select_ht_combo(self.intake_combo, self.intake_var,
-                              el.get("L3", "") if el is not None else "", self.intake_ht)
-        el = clone_root.find("Exhaust/Upgrade")
-        self._select_ht_combo(self.exhaust_combo, self.exhaust_var,
-                              el.get("L3", "") if el is not None else "", self.exhaust_ht)
+        # Update redline and component selectors from clone
+        self._apply_root_to_selectors(clone_root)
 
         # Show override message
         self.clone_msg_var.set(
@@ -1206,6 +1675,7 @@ class FM4CarAudioTuner:
             f"To adjust cloned settings go to:\n{clone_display}")
 
         self.status_var.set(f"Cloned audio from: {clone_display}")
+        self._on_possible_edit()
 
     # ---- HT dropdown management ----
 
@@ -1217,19 +1687,9 @@ class FM4CarAudioTuner:
         if not parsed:
             return
         cyl_key = parsed[3]  # e.g. "4", "8", "2R", "NA"
-        if cyl_key == "2R":
-            option = "Rotary"
-        elif cyl_key in CYLINDER_OPTIONS:
-            option = cyl_key
-        else:
-            # Map keys like "2", "3", "16" to their group's canonical option
-            for opt in CYLINDER_OPTIONS:
-                group = CYLINDER_GROUPS.get(opt, [])
-                if cyl_key in group:
-                    option = opt
-                    break
-            else:
-                return
+        option = CYLINDER_KEY_TO_OPTION.get(cyl_key)
+        if option is None:
+            return
         if self.cyl_var.get() != option:
             self.cyl_var.set(option)
             self._update_ht_dropdowns()
@@ -1239,14 +1699,30 @@ class FM4CarAudioTuner:
 
     def _update_ht_dropdowns(self):
         cyl_sel = self.cyl_var.get()
-        allowed = CYLINDER_GROUPS.get(cyl_sel, [])
+        filtered = self._ht_filtered
+        for attr, combo in self._ht_slots:
+            by_cyl = filtered[attr]
+            combo["values"] = by_cyl.get(cyl_sel, by_cyl[None])
 
-        def matches(entry):
-            return entry["cyl_key"] in allowed or entry["cyl_key"] == "NA"
+    def _apply_root_to_selectors(self, root):
+        """Set redline and the Engine/Intake/Exhaust selectors from an ET root.
 
-        for attr, ht_list in [("engine", self.engine_ht), ("intake", self.intake_ht), ("exhaust", self.exhaust_ht)]:
-            filtered = [e["display"] for e in ht_list if matches(e)]
-            getattr(self, f"{attr}_combo")["values"] = filtered
+        Returns the exhaust HT filename (for cylinder auto-detect).
+        """
+        index = self._et_elements(root)
+
+        settings = index.get("EngineSettings")
+        self.redline_var.set(settings.get("audio_rpm_redline", "") if settings is not None else "")
+
+        filename = ""
+        for tag, attr, combo, var, ht_list in [
+                ("EngineAmbient", "L0", self.engine_combo, self.engine_var, self.engine_ht),
+                ("EngineIntake", "L3", self.intake_combo, self.intake_var, self.intake_ht),
+                ("Exhaust", "L3", self.exhaust_combo, self.exhaust_var, self.exhaust_ht)]:
+            el = index[f"{tag}/Upgrade"]
+            filename = el.get(attr, "") if el is not None else ""
+            self._select_ht_combo(combo, var, filename, ht_list)
+        return filename
 
     def _select_ht_combo(self, combo, var, filename, ht_list):
         display = ht_display_name(filename)
@@ -1256,18 +1732,69 @@ class FM4CarAudioTuner:
             combo["values"] = values
         var.set(display)
 
-    def _get_filename_from_display(self, display, ht_list):
-        for entry in ht_list:
-            if entry["display"] == display:
-                return entry["filename"]
-        return None
+    def _load_ht_lists(self):
+        self.engine_ht, self.intake_ht, self.exhaust_ht = load_ht_files()
+        # display -> filename lookups; the first entry for a display name wins
+        self.engine_ht_by_display, self.intake_ht_by_display, self.exhaust_ht_by_display = (
+            {e["display"]: e["filename"] for e in reversed(ht_list)}
+            for ht_list in (self.engine_ht, self.intake_ht, self.exhaust_ht))
+
+        # attr -> Cyl option -> dropdown values (entries in the option's group plus "NA"
+        # ones); the None bucket is for an option with no group
+        self._ht_filtered = {}
+        for attr, ht_list in [("engine", self.engine_ht), ("intake", self.intake_ht), ("exhaust", self.exhaust_ht)]:
+            by_cyl = {}
+            for cyl_sel in CYLINDER_OPTIONS + (None,):
+                allowed = CYLINDER_GROUPS.get(cyl_sel, frozenset())
+                by_cyl[cyl_sel] = tuple(e["display"] for e in ht_list
+                                        if e["cyl_key"] in allowed or e["cyl_key"] == "NA")
+            self._ht_filtered[attr] = by_cyl
+
+    def _get_filename_from_display(self, display, ht_by_display):
+        return ht_by_display.get(display)
 
     # ---- Car selection / data load ----
 
+    def _parse_car_tree(self, path):
+        """Return a private copy of path's parsed tree, parsing only on an LRU miss.
+
+        Entries are keyed by mtime and size, so a file changed on disk is reparsed.
+        """
+        st = os.stat(path)
+        key = (path, st.st_mtime_ns, st.st_size)
+        cache = self._tree_cache
+        tree = cache.get(key)
+        if tree is None:
+            tree = ET.parse(path)
+            cache[key] = tree
+            if len(cache) > TREE_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        # Callers edit the tree in place, so never hand out the cached one
+        return ET.ElementTree(copy.deepcopy(tree.getroot()))
+
+    def _read_car_root(self, path):
+        """Root of path for read-only use: the cached full tree if present, else a sections-only parse."""
+        st = os.stat(path)
+        tree = self._tree_cache.get((path, st.st_mtime_ns, st.st_size))
+        if tree is not None:
+            return tree.getroot()
+        return parse_et_sections(path).getroot()
+
+    def _drop_cached_trees(self, path):
+        for key in [k for k in self._tree_cache if k[0] == path]:
+            del self._tree_cache[key]
+
     def _on_car_selected(self, event):
         sel = self.car_listbox.curselection()
         if not sel:
             return
+        if sel[0] >= self._car_rows_shown:
+            # Tail row: show the next page instead of loading a car
+            self.car_listbox.selection_clear(0, tk.END)
+            self._add_car_rows(CAR_LIST_PAGE)
+            return
         idx = self._filtered_indices[sel[0]]
         car_file = self.car_files[idx]
         self.current_car_file = car_file
@@ -1278,24 +1805,16 @@ class FM4CarAudioTuner:
             if path is None:
                 messagebox.showerror("Error", f"Cannot find file: {car_file}")
                 return
-            self.current_tree = ET.parse(path)
+            self.current_tree = self._parse_car_tree(path)
             root = self.current_tree.getroot()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to parse {car_file}:\n{e}")
             return
 
-        # Redline
-        settings = root.find("EngineSettings")
-        self.redline_var.set(settings.get("audio_rpm_redline", "") if settings is not None else "")
+        self._ensure_tabs_built()
 
-        # Component selectors
-        el = root.find("EngineAmbient/Upgrade")
-        self._select_ht_combo(self.engine_combo, self.engine_var, el.get("L0", "") if el is not None else "", self.engine_ht)
-        el = root.find("EngineIntake/Upgrade")
-        self._select_ht_combo(self.intake_combo, self.intake_var, el.get("L3", "") if el is not None else "", self.intake_ht)
-        el = root.find("Exhaust/Upgrade")
-        exh_filename = el.get("L3", "") if el is not None else ""
-        self._select_ht_combo(self.exhaust_combo, self.exhaust_var, exh_filename, self.exhaust_ht)
+        # Redline and component selectors
+        exh_filename = self._apply_root_to_selectors(root)
 
         # Auto-detect cylinder type from exhaust HT filename
         self._auto_detect_cylinders(exh_filename)
@@ -1314,205 +1833,243 @@ class FM4CarAudioTuner:
         self._undo_stack.clear()
         self._redo_stack.clear()
         self._last_state = self._capture_state()
+        self._saved_state = dict(self._last_state)
+        self._edit_pending = False
         self.status_var.set(f"Loaded: {self.car_display[idx]}")
 
+    def _et_elements(self, root):
+        """et_element_index(root), reused until a different root is passed."""
+        if self._et_index_root is not root:
+            self._et_index_root = root
+            self._et_index = et_element_index(root)
+            self._child_indexes = {}
+        return self._et_index
+
+    def _children(self, elem):
+        """_index_children(elem), kept until _et_elements indexes a different root.
+
+        Load and save walk the same elements, so save reuses the maps built on load.
+        """
+        if elem is None:
+            return {}
+        index = self._child_indexes.get(elem)
+        if index is None:
+            index = self._child_indexes[elem] = _index_children(elem)
+        return index
+
     def _load_emission_group(self, root, group_name, tab):
-        eg = root.find(f"HarmonicTunings/{group_name}")
+        eg = self._et_elements(root).get(f"HarmonicTunings/{group_name}")
         if eg is None:
             return
+        eg_map = self._children(eg)
+        vol_gain = self._children(eg_map.get("Volume")).get("Gain")
 
         # Volume
-        tab["vol_gain"].load_from_xml(eg.find("Volume/Gain"))
+        tab["vol_gain"].load_from_xml(vol_gain)
 
         # PEQ
-        peq = eg.find("PEQ")
+        peq = eg_map.get("PEQ")
         if peq is not None:
+            peq_map = self._children(peq)
             tab["peq_active"].set(int(peq.get("Active", "0")))
-            tab["peq_gain"].load_from_xml(peq.find("Gain"))
-            tab["peq_freq"].load_from_xml(peq.find("CenterFrequency"))
-            tab["peq_bw"].load_from_xml(peq.find("Bandwidth"))
+            for tag, key in PEQ_PARAMS["peq"]:
+                tab[key].load_from_xml(peq_map.get(tag))
 
         # Lowpass
-        lp = eg.find("Lowpass")
+        lp = eg_map.get("Lowpass")
         if lp is not None:
+            lp_map = self._children(lp)
             tab["lp_active"].set(int(lp.get("Active", "0")))
-            tab["lp_cutoff"].load_from_xml(lp.find("CutoffFrequency"))
-            tab["lp_res"].load_from_xml(lp.find("Resonance"))
+            tab["lp_cutoff"].load_from_xml(lp_map.get("CutoffFrequency"))
+            tab["lp_res"].load_from_xml(lp_map.get("Resonance"))
 
         # Exhaust extras
         if "exp_maxgain" in tab:
-            exp = eg.find("Expander")
+            exp = eg_map.get("Expander")
             if exp is not None:
-                tab["exp_maxgain"].load_from_xml(exp.find("MaxGain"))
-                settings = exp.find("Settings")
+                exp_map = self._children(exp)
+                tab["exp_maxgain"].load_from_xml(exp_map.get("MaxGain"))
+                settings = exp_map.get("Settings")
                 if settings is not None:
-                    for attr in ["AttackTime", "HoldTime", "ReleaseTime"]:
-                        tab[f"exp_{attr.lower()}"].set(settings.get(attr, "0.0"))
+                    for attr, key in EXP_SETTINGS:
+                        tab[key].set(settings.get(attr, "0.0"))
 
-            lpeq = eg.find("LoadPEQ")
+            lpeq = eg_map.get("LoadPEQ")
             if lpeq is not None:
-                pos = lpeq.find("PosLoad")
+                lpeq_map = self._children(lpeq)
+                pos = lpeq_map.get("PosLoad")
                 if pos is not None:
+                    pos_map = self._children(pos)
                     tab["posload_active"].set(int(pos.get("Active", "0")))
-                    tab["posload_gain"].load_from_xml(pos.find("Gain"))
-                    tab["posload_freq"].load_from_xml(pos.find("CenterFrequency"))
-                    tab["posload_bw"].load_from_xml(pos.find("Bandwidth"))
-                neg = lpeq.find("NegLoad")
+                    for tag, key in PEQ_PARAMS["posload"]:
+                        tab[key].load_from_xml(pos_map.get(tag))
+                neg = lpeq_map.get("NegLoad")
                 if neg is not None:
+                    neg_map = self._children(neg)
                     tab["negload_active"].set(int(neg.get("Active", "0")))
-                    tab["negload_gain"].load_from_xml(neg.find("Gain"))
-                    tab["negload_freq"].load_from_xml(neg.find("CenterFrequency"))
-                    tab["negload_bw"].load_from_xml(neg.find("Bandwidth"))
+                    for tag, key in PEQ_PARAMS["negload"]:
+                        tab[key].load_from_xml(neg_map.get(tag))
 
     def _load_global_effects(self, root):
         w = self.global_tab
+        index = self._et_elements(root)
 
         # FocusPEQ
-        fpeq = root.find("FocusPEQ")
+        fpeq = index.get("FocusPEQ")
         if fpeq is not None:
+            fpeq_map = self._children(fpeq)
             w["fpeq_active"].set(int(fpeq.get("Active", "0")))
-            w["fpeq_gain"].load_from_xml(fpeq.find("Gain"))
-            w["fpeq_freq"].load_from_xml(fpeq.find("CenterFrequency"))
-            w["fpeq_bw"].load_from_xml(fpeq.find("Bandwidth"))
+            for tag, key in PEQ_PARAMS["fpeq"]:
+                w[key].load_from_xml(fpeq_map.get(tag))
 
         # Distortion
-        dist = root.find("Distortion")
+        dist = index.get("Distortion")
         if dist is not None:
             w["dist_active"].set(int(dist.get("Active", "0")))
             w["dist_volcomp"].set(dist.get("VolumeCompensate", "0.0"))
             w["dist_level"].load_from_xml(dist.find("Level"))
 
         # Compressor
-        comp = root.find("Compressor")
+        comp = index.get("Compressor")
         if comp is not None:
             w["comp_active"].set(int(comp.get("Active", "0")))
-            for attr in ["Threshold", "Attack", "Release", "GainMakeup"]:
-                w[f"comp_{attr.lower()}"].set(comp.get(attr, "0.0"))
+            for attr, key in COMP_SETTINGS:
+                w[key].set(comp.get(attr, "0.0"))
 
         # ShiftVolumeScalar
-        svs = root.find("ShiftVolumeScalar")
+        svs = index.get("ShiftVolumeScalar")
         if svs is not None:
-            for attr in ["ShiftVolBoostUpPct", "ShiftVolBoostUpTime", "ShiftVolBoostDownPct", "ShiftVolBoostDownTime"]:
-                w[f"svs_{attr.lower()}"].set(svs.get(attr, "0.0"))
+            for attr, key in SVS_SETTINGS:
+                w[key].set(svs.get(attr, "0.0"))
 
         # TrashDSP
-        trash = root.find("TrashDSP")
+        trash = index.get("TrashDSP")
         if trash is not None:
+            trash_map = self._children(trash)
             w["trash_active"].set(int(trash.get("Active", "0")))
             w["trash_usecurves"].set(int(trash.get("UseCurves", "0")))
             w["trash_volcomp"].set(trash.get("VolumeCompensate", "0.0"))
             w["trash_cutoff1"].set(trash.get("Cutoff1", "0"))
             w["trash_cutoff2"].set(trash.get("Cutoff2", "0"))
 
-            for band_num in range(1, 4):
-                band = trash.find(f"Band{band_num}")
+            for band_tag, effecttype_key, scalars in TRASH_BANDS:
+                band = trash_map.get(band_tag)
                 if band is None:
                     continue
-                w[f"trash_b{band_num}_effecttype"].set(band.get("effecttype", "1.000000"))
-                for scalar in ["inputgain", "overdrive", "mix", "outputgain"]:
-                    w[f"trash_b{band_num}_{scalar}_attr"].set(band.get(scalar, "0.0"))
-                    child = band.find(scalar)
+                band_map = self._children(band)
+                w[effecttype_key].set(band.get("effecttype", "1.000000"))
+                for scalar, attr_key, block_key in scalars:
+                    w[attr_key].set(band.get(scalar, "0.0"))
+                    child = band_map.get(scalar)
                     if child is not None:
-                        w[f"trash_b{band_num}_{scalar}"].load_from_xml(child)
+                        w[block_key].load_from_xml(child)
 
     # ---- Save emission group back to XML ----
 
     def _save_emission_group(self, root, group_name, tab):
-        eg = root.find(f"HarmonicTunings/{group_name}")
+        eg = self._et_elements(root).get(f"HarmonicTunings/{group_name}")
         if eg is None:
             return
+        eg_map = self._children(eg)
+        vol_gain = self._children(eg_map.get("Volume")).get("Gain")
 
-        tab["vol_gain"].save_to_xml(eg.find("Volume/Gain"))
+        tab["vol_gain"].save_to_xml(vol_gain)
 
         # If volume muted, zero out the curve Y values in XML
         if not tab["vol_active"].get():
-            vol_tc = eg.find("Volume/Gain/ThreePointCurve")
+            vol_tc = self._children(vol_gain).get("ThreePointCurve")
             if vol_tc is not None:
                 for attr in ("y0", "y1", "y2"):
                     vol_tc.set(attr, "0.000000")
 
-        peq = eg.find("PEQ")
+        peq = eg_map.get("PEQ")
         if peq is not None:
+            peq_map = self._children(peq)
             peq.set("Active", str(tab["peq_active"].get()))
-            tab["peq_gain"].save_to_xml(peq.find("Gain"))
-            tab["peq_freq"].save_to_xml(peq.find("CenterFrequency"))
-            tab["peq_bw"].save_to_xml(peq.find("Bandwidth"))
+            for tag, key in PEQ_PARAMS["peq"]:
+                tab[key].save_to_xml(peq_map.get(tag))
 
-        lp = eg.find("Lowpass")
+        lp = eg_map.get("Lowpass")
         if lp is not None:
+            lp_map = self._children(lp)
             lp.set("Active", str(tab["lp_active"].get()))
-            tab["lp_cutoff"].save_to_xml(lp.find("CutoffFrequency"))
-            tab["lp_res"].save_to_xml(lp.find("Resonance"))
+            tab["lp_cutoff"].save_to_xml(lp_map.get("CutoffFrequency"))
+            tab["lp_res"].save_to_xml(lp_map.get("Resonance"))
 
         if "exp_maxgain" in tab:
-            exp = eg.find("Expander")
+            exp = eg_map.get("Expander")
             if exp is not None:
-                tab["exp_maxgain"].save_to_xml(exp.find("MaxGain"))
-                settings = exp.find("Settings")
+                exp_map = self._children(exp)
+                tab["exp_maxgain"].save_to_xml(exp_map.get("MaxGain"))
+                settings = exp_map.get("Settings")
                 if settings is not None:
-                    for attr in ["AttackTime", "HoldTime", "ReleaseTime"]:
-                        settings.set(attr, tab[f"exp_{attr.lower()}"].get())
+                    for attr, key in EXP_SETTINGS:
+                        settings.set(attr, tab[key].get())
 
-            lpeq = eg.find("LoadPEQ")
+            lpeq = eg_map.get("LoadPEQ")
             if lpeq is not None:
-                pos = lpeq.find("PosLoad")
+                lpeq_map = self._children(lpeq)
+                pos = lpeq_map.get("PosLoad")
                 if pos is not None:
+                    pos_map = self._children(pos)
                     pos.set("Active", str(tab["posload_active"].get()))
-                    tab["posload_gain"].save_to_xml(pos.find("Gain"))
-                    tab["posload_freq"].save_to_xml(pos.find("CenterFrequency"))
-                    tab["posload_bw"].save_to_xml(pos.find("Bandwidth"))
-                neg = lpeq.find("NegLoad")
+                    for tag, key in PEQ_PARAMS["posload"]:
+                        tab[key].save_to_xml(pos_map.get(tag))
+                neg = lpeq_map.get("NegLoad")
                 if neg is not None:
+                    neg_map = self._children(neg)
                     neg.set("Active", str(tab["negload_active"].get()))
-                    tab["negload_gain"].save_to_xml(neg.find("Gain"))
-                    tab["negload_freq"].save_to_xml(neg.find("CenterFrequency"))
-                    tab["negload_bw"].save_to_xml(neg.find("Bandwidth"))
+                    for tag, key in PEQ_PARAMS["negload"]:
+                        tab[key].save_to_xml(neg_map.get(tag))
 
     def _save_global_effects(self, root):
         w = self.global_tab
+        index = self._et_elements(root)
 
-        fpeq = root.find("FocusPEQ")
+        fpeq = index.get("FocusPEQ")
         if fpeq is not None:
+            fpeq_map = self._children(fpeq)
             fpeq.set("Active", str(w["fpeq_active"].get()))
-            w["fpeq_gain"].save_to_xml(fpeq.find("Gain"))
-            w["fpeq_freq"].save_to_xml(fpeq.find("CenterFrequency"))
-            w["fpeq_bw"].save_to_xml(fpeq.find("Bandwidth"))
+            for tag, key in PEQ_PARAMS["fpeq"]:
+                w[key].save_to_xml(fpeq_map.get(tag))
 
-        dist = root.find("Distortion")
+        dist = index.get("Distortion")
         if dist is not None:
             dist.set("Active", str(w["dist_active"].get()))
             dist.set("VolumeCompensate", w["dist_volcomp"].get())
             w["dist_level"].save_to_xml(dist.find("Level"))
 
-        comp = root.find("Compressor")
+        comp = index.get("Compressor")
         if comp is not None:
             comp.set("Active", str(w["comp_active"].get()))
-            for attr in ["Threshold", "Attack", "Release", "GainMakeup"]:
-                comp.set(attr, w[f"comp_{attr.lower()}"].get())
+            for attr, key in COMP_SETTINGS:
+                comp.set(attr, w[key].get())
 
-        svs = root.find("ShiftVolumeScalar")
+        svs = index.get("ShiftVolumeScalar")
         if svs is not None:
-            for attr in ["ShiftVolBoostUpPct", "ShiftVolBoostUpTime", "ShiftVolBoostDownPct", "ShiftVolBoostDownTime"]:
-                svs.set(attr, w[f"svs_{attr.lower()}"].get())
+            for attr, key in SVS_SETTINGS:
+                svs.set(attr, w[key].get())
 
-        trash = root.find("TrashDSP")
+        trash = index.get("TrashDSP")
         if trash is not None:
+            trash_map = self._children(trash)
             trash.set("Active", str(w["trash_active"].get()))
             trash.set("UseCurves", str(w["trash_usecurves"].get()))
             trash.set("VolumeCompensate", w["trash_volcomp"].get())
             trash.set("Cutoff1", w["trash_cutoff1"].get())
             trash.set("Cutoff2", w["trash_cutoff2"].get())
 
-            for band_num in range(1, 4):
-                band = trash.find(f"Band{band_num}")
+            for band_tag, effecttype_key, scalars in TRASH_BANDS:
+                band = trash_map.get(band_tag)
                 if band is None:
                     continue
-                band.set("effecttype", w[f"trash_b{band_num}_effecttype"].get())
-                for scalar in ["inputgain", "overdrive", "mix", "outputgain"]:
-                    band.set(scalar, w[f"trash_b{band_num}_{scalar}_attr"].get())
-                    child = band.find(scalar)
+                band_map = self._children(band)
+                band.set("effecttype", w[effecttype_key].get())
+                for scalar, attr_key, block_key in scalars:
+                    band.set(scalar, w[attr_key].get())
+                    child = band_map.get(scalar)
                     if child is not None:
-                        w[f"trash_b{band_num}_{scalar}"].save_to_xml(child)
+                        w[block_key].save_to_xml(child)
 
     # ---- Volume sidecar (preserve values when muted) ----
 
@@ -1531,12 +2088,13 @@ class FM4CarAudioTuner:
             if not tab["vol_active"].get():
                 # Muted - preserve the real UI values
                 data[group_name] = {
-                    "pc": tab["vol_gain"].physcoef.get_values(),
-                    "curve": tab["vol_gain"].curve.get_values(),
+                    "pc": dict(tab["vol_gain"].physcoef.get_values()),
+                    "curve": dict(tab["vol_gain"].curve.get_values()),
                 }
         if data:
-            with open(sidecar_path, "w") as f:
-                json.dump(data, f, indent=2)
+            payload = json.dumps(data, separators=(",", ":")).encode("ascii")
+            with open(sidecar_path, "wb") as f:
+                f.write(payload)
         else:
             # All active - remove sidecar if it exists
             if os.path.isfile(sidecar_path):
@@ -1545,17 +2103,16 @@ class FM4CarAudioTuner:
     def _load_vol_sidecar(self, car_file):
         """Restore preserved volume values and set Active toggles."""
         sidecar_path = self._vol_sidecar_path(car_file)
-        if not os.path.isfile(sidecar_path):
+        try:
+            with open(sidecar_path, "rb") as f:
+                data = json.loads(f.read())
+        except FileNotFoundError:
             # No sidecar - all volumes active
             self.intake_tab["vol_active"].set(1)
             self.engine_tab["vol_active"].set(1)
             self.exhaust_tab["vol_active"].set(1)
             return
-
-        try:
-            with open(sidecar_path, "r") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, OSError):
+        except (ValueError, OSError):
             return
 
         for group_name, tab in [("EmissionGroup0", self.intake_tab),
@@ -1577,134 +2134,148 @@ class FM4CarAudioTuner:
 
     # ---- Undo / Redo ----
 
+    def _set_cached(self, key, value):
+        """Store a snapshot value, flagging _edit_pending when it changes."""
+        cache = self._value_cache
+        if key in cache and cache[key] == value:
+            return
+        cache[key] = value
+        self._edit_pending = True
+
+    def _refresh_block_cache(self):
+        """Re-read the ParamBlocks whose editors changed since they were last cached."""
+        revs = self._block_revs
+        for key, block in self._param_blocks.items():
+            rev = (block.physcoef.revision, block.curve.revision)
+            if revs.get(key) != rev:
+                revs[key] = rev
+                self._set_cached(f"{key}.pc", tuple(v for _, v in block.physcoef.get_values()))
+                self._set_cached(f"{key}.cv", tuple(v for _, v in block.curve.get_values()))
+
     def _capture_state(self):
-        """Snapshot all widget values into a comparable tuple."""
-        state = {}
-        state["redline"] = self.redline_var.get()
-        state["engine"] = self.engine_var.get()
-        state["intake_sel"] = self.intake_var.get()
-        state["exhaust_sel"] = self.exhaust_var.get()
-
-        for tab_name, tab in [("int", self.intake_tab), ("eng", self.engine_tab), ("exh", self.exhaust_tab)]:
-            for key, widget in tab.items():
-                if key == "frame":
-                    continue
-                if isinstance(widget, ParamBlock):
-                    pc = widget.physcoef.get_values()
-                    cv = widget.curve.get_values()
-                    state[f"{tab_name}.{key}.pc"] = (pc["RPM"], pc["Throttle"], pc["PosTorque"], pc["NegTorque"])
-                    state[f"{tab_name}.{key}.cv"] = (cv["x0"], cv["y0"], cv["x1"], cv["y1"], cv["x2"], cv["y2"])
-                elif isinstance(widget, (tk.IntVar, tk.StringVar)):
-                    state[f"{tab_name}.{key}"] = str(widget.get())
-
-        for key, widget in self.global_tab.items():
-            if key == "frame":
-                continue
-            if isinstance(widget, ParamBlock):
-                pc = widget.physcoef.get_values()
-                cv = widget.curve.get_values()
-                state[f"g.{key}.pc"] = (pc["RPM"], pc["Throttle"], pc["PosTorque"], pc["NegTorque"])
-                state[f"g.{key}.cv"] = (cv["x0"], cv["y0"], cv["x1"], cv["y1"], cv["x2"], cv["y2"])
-            elif isinstance(widget, (tk.IntVar, tk.StringVar)):
-                state[f"g.{key}"] = str(widget.get())
-
-        return tuple(sorted(state.items()))
-
-    def _restore_state(self, state):
-        """Write a snapshot back to all widgets."""
-        self._restoring = True
-        d = dict(state)
+        """Snapshot all widget values into a dict keyed by widget path.
 
-        self.redline_var.set(d.get("redline", ""))
-        self.engine_var.set(d.get("engine", ""))
-        self.intake_var.set(d.get("intake_sel", ""))
-        self.exhaust_var.set(d.get("exhaust_sel", ""))
+        Tk variables are kept current in _value_cache by write traces; only
+        ParamBlocks whose editors changed since the last snapshot are re-read.
+        No Tcl calls are made.
+        """
+        self._refresh_block_cache()
+        return dict(self._value_cache)
 
-        for tab_name, tab in [("int", self.intake_tab), ("eng", self.engine_tab), ("exh", self.exhaust_tab)]:
-            for key, widget in tab.items():
-                if key == "frame":
-                    continue
-                if isinstance(widget, ParamBlock):
-                    pc_key = f"{tab_name}.{key}.pc"
-                    cv_key = f"{tab_name}.{key}.cv"
-                    if pc_key in d:
-                        widget.physcoef.set_values(*d[pc_key])
-                    if cv_key in d:
-                        widget.curve.set_values(*d[cv_key])
-                    widget._update_flat_mode()
-                elif isinstance(widget, tk.IntVar):
-                    val = d.get(f"{tab_name}.{key}")
-                    if val is not None:
-                        widget.set(int(val))
-                elif isinstance(widget, tk.StringVar):
-                    val = d.get(f"{tab_name}.{key}")
-                    if val is not None:
-                        widget.set(val)
-
-        for key, widget in self.global_tab.items():
-            if key == "frame":
-                continue
-            if isinstance(widget, ParamBlock):
-                pc_key = f"g.{key}.pc"
-                cv_key = f"g.{key}.cv"
-                if pc_key in d:
-                    widget.physcoef.set_values(*d[pc_key])
-                if cv_key in d:
-                    widget.curve.set_values(*d[cv_key])
-                widget._update_flat_mode()
-            elif isinstance(widget, tk.IntVar):
-                val = d.get(f"g.{key}")
-                if val is not None:
-                    widget.set(int(val))
-            elif isinstance(widget, tk.StringVar):
-                val = d.get(f"g.{key}")
-                if val is not None:
-                    widget.set(val)
+    def _restore_state(self, d):
+        """Write snapshot values (all or any subset of _capture_state keys) back to widgets.
 
-        self._restoring = False
+        Each touched ParamBlock gets its flat-mode check once, after both of its
+        editors are set, and pending redraws are flushed in a single pass.
+        """
+        self._restoring = True
+        try:
+            cached_vars = self._cached_vars
+            blocks = self._param_blocks
+            touched = {}
+            for key, val in d.items():
+                if val is None:
+                    continue
+                var = cached_vars.get(key)
+                if var is not None:
+                    var.set(int(val) if isinstance(var, tk.IntVar) else val)
+                    continue
+                prefix, _, part = key.rpartition(".")
+                block = blocks.get(prefix)
+                if block is None:
+                    continue
+                if part == "pc":
+                    block.physcoef.set_values(*val)
+                elif part == "cv":
+                    block.curve.set_values(*val)
+                else:
+                    continue
+                touched[prefix] = block
+            for block in touched.values():
+                block._update_flat_mode()
+            self.root.update_idletasks()
+        finally:
+            self._restoring = False
+
+    def _blocks_changed(self):
+        """True if any ParamBlock was edited since _value_cache last read it."""
+        revs = self._block_revs
+        for key, block in self._param_blocks.items():
+            if revs.get(key) != (block.physcoef.revision, block.curve.revision):
+                return True
+        return False
 
     def _on_possible_edit(self, event=None):
         if self.current_tree is None or self._restoring:
             return
+        if not self._edit_pending and not self._blocks_changed():
+            return  # Navigation or focus change only; nothing to snapshot
+        self._schedule_undo_check()
+
+    def _schedule_undo_check(self):
         if self._edit_timer:
             self.root.after_cancel(self._edit_timer)
         self._edit_timer = self.root.after(150, self._check_and_push_undo)
 
     def _check_and_push_undo(self):
         self._edit_timer = None
-        current = self._capture_state()
-        if self._last_state is not None and current != self._last_state:
-            self._undo_stack.append(self._last_state)
-            if len(self._undo_stack) > 50:
-                self._undo_stack.pop(0)
+        self._refresh_block_cache()
+        if not self._edit_pending:
+            return  # Nothing changed since the last snapshot
+        self._edit_pending = False
+        current = dict(self._value_cache)
+        last = self._last_state
+        if last is not None and current != last:
+            # Undo entries only hold the fields that changed: key -> (before, after)
+            delta = {k: (last.get(k), v) for k, v in current.items() if last.get(k) != v}
+            self._undo_stack.append(delta)
             self._redo_stack.clear()
         self._last_state = current
 
+    def _flush_pending_edit(self):
+        """Record any edit not yet pushed so the undo stack top is current."""
+        if self._edit_timer or self._edit_pending or self._blocks_changed():
+            if self._edit_timer:
+                self.root.after_cancel(self._edit_timer)
+            self._check_and_push_undo()
+
+    def _apply_delta(self, delta, side):
+        """Restore one side (0 = before, 1 = after) of an undo delta."""
+        values = {k: pair[side] for k, pair in delta.items()}
+        self._restore_state(values)
+        self._last_state.update(values)
+        self._refresh_block_cache()
+        self._edit_pending = False
+
     def _on_undo(self, event=None):
-        if not self._undo_stack or self.current_tree is None:
+        if self.current_tree is None:
             return "break"
-        current = self._capture_state()
-        self._redo_stack.append(current)
-        state = self._undo_stack.pop()
-        self._restore_state(state)
-        self._last_state = state
+        self._flush_pending_edit()
+        if not self._undo_stack:
+            return "break"
+        delta = self._undo_stack.pop()
+        self._redo_stack.append(delta)
+        self._apply_delta(delta, 0)
         self.status_var.set("Undo")
         return "break"
 
     def _on_redo(self, event=None):
-        if not self._redo_stack or self.current_tree is None:
+        if self.current_tree is None:
             return "break"
-        current = self._capture_state()
-        self._undo_stack.append(current)
-        state = self._redo_stack.pop()
-        self._restore_state(state)
-        self._last_state = state
+        self._flush_pending_edit()
+        if not self._redo_stack:
+            return "break"
+        delta = self._redo_stack.pop()
+        self._undo_stack.append(delta)
+        self._apply_delta(delta, 1)
         self.status_var.set("Redo")
         return "break"
 
     # ---- Save / Export ----
 
     def _on_save(self):
+        if self._export_job is not None or self._find_job is not None:
+            return  # Buttons are greyed out; this covers any other way in
         if not self.current_car_file or self.current_tree is None:
             messagebox.showwarning("No Car", "Please select a car first.")
             return
@@ -1717,34 +2288,43 @@ class FM4CarAudioTuner:
         root = self.current_tree.getroot()
 
         # Update top-level fields
-        settings = root.find("EngineSettings")
+        index = self._et_elements(root)
+        settings = index.get("EngineSettings")
         if settings is not None:
             settings.set("audio_rpm_redline", redline)
 
         # Component selectors
-        eng_file = self._get_filename_from_display(self.engine_var.get(), self.engine_ht)
-        int_file = self._get_filename_from_display(self.intake_var.get(), self.intake_ht)
-        exh_file = self._get_filename_from_display(self.exhaust_var.get(), self.exhaust_ht)
+        eng_file = self._get_filename_from_display(self.engine_var.get(), self.engine_ht_by_display)
+        int_file = self._get_filename_from_display(self.intake_var.get(), self.intake_ht_by_display)
+        exh_file = self._get_filename_from_display(self.exhaust_var.get(), self.exhaust_ht_by_display)
 
-        el = root.find("EngineAmbient/Upgrade")
+        el = index["EngineAmbient/Upgrade"]
         if el is not None and eng_file:
             el.set("L0", eng_file)
-        el = root.find("EngineIntake/Upgrade")
+        el = index["EngineIntake/Upgrade"]
         if el is not None and int_file:
             for attr in ["L0", "L1", "L2", "L3"]:
                 el.set(attr, int_file)
-        el = root.find("Exhaust/Upgrade")
+        el = index["Exhaust/Upgrade"]
         if el is not None and exh_file:
             for attr in ["L0", "L1", "L2", "L3"]:
                 el.set(attr, exh_file)
 
-        # Save all emission groups
-        self._save_emission_group(root, "EmissionGroup0", self.intake_tab)
-        self._save_emission_group(root, "EmissionGroup1", self.engine_tab)
-        self._save_emission_group(root, "EmissionGroup2", self.exhaust_tab)
-
-        # Save global effects
-        self._save_global_effects(root)
+        # Save emission groups and global effects, skipping tabs unchanged
+        # since the tree last matched the widgets
+        current = self._capture_state()
+        saved = self._saved_state
+        if saved is None:
+            dirty = {"int", "eng", "exh", "g"}
+        else:
+            dirty = {key.partition(".")[0] for key, value in current.items() if saved.get(key) != value}
+        for prefix, group_name, tab in (("int", "EmissionGroup0", self.intake_tab),
+                                        ("eng", "EmissionGroup1", self.engine_tab),
+                                        ("exh", "EmissionGroup2", self.exhaust_tab)):
+            if prefix in dirty:
+                self._save_emission_group(root, group_name, tab)
+        if "g" in dirty:
+            self._save_global_effects(root)
 
         # Update volume sidecar
         self._save_vol_sidecar(self.current_car_file)
@@ -1755,10 +2335,14 @@ class FM4CarAudioTuner:
             os.makedirs(DLC_ET_DIR, exist_ok=True)
             path = os.path.join(DLC_ET_DIR, self.current_car_file)
         write_xml_file(self.current_tree, path)
+        self._drop_cached_trees(path)
+        self._saved_state = current
         self.status_var.set(f"Saved: {self.current_car_file}")
 
     def _on_export(self):
         """Repackage main game ZIP + copy DLC loose files to mapped or override paths."""
+        if self._export_job is not None or self._find_job is not None:
+            return  # Buttons are greyed out; this covers any other way in
         if not os.path.isfile(BACKUP_ZIP):
             messagebox.showerror("Missing Backup", f"Cannot find:\n{BACKUP_ZIP}")
             return
@@ -1780,88 +2364,138 @@ class FM4CarAudioTuner:
             has_override = True
 
         self.status_var.set("Exporting: packaging main ZIP...")
-        self.root.update()
-
+        job = {"output_override": output_override, "has_override": has_override,
+               "file_mapping": self.file_mapping, "status": None,
+               "result": None, "error": None}
+        worker = threading.Thread(target=self._export_worker, args=(job,), daemon=True)
+        self._export_job = (worker, job)
+        self._set_file_ops_enabled(False)
+        worker.start()
+        self.root.after(100, self._poll_export)
+
+    def _export_worker(self, job):
+        """Run the export pipeline off the Tk thread; only touches the job dict."""
+        output_override = job["output_override"]
+        has_override = job["has_override"]
+        file_mapping = job["file_mapping"]
         try:
             # --- Step 1: Repackage main game enginetuning.zip ---
-            shutil.copy2(BACKUP_ZIP, OUTPUT_ZIP)
-            self.status_var.set("Exporting: QuickBMS reimport...")
-            self.root.update()
+            copy_file(BACKUP_ZIP, OUTPUT_ZIP)
+            job["status"] = "Exporting: QuickBMS reimport..."
 
             subprocess.run(
-                [QUICKBMS_EXE, "-w", "-r", "-r", "-r", ZIP_BMS, OUTPUT_ZIP, ET_DIR],
-                capture_output=True, text=True, timeout=120)
+                [QUICKBMS_EXE, "-q", "-w", "-r", "-r", "-r", ZIP_BMS, OUTPUT_ZIP, ET_DIR],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=120)
 
-            self.status_var.set("Exporting: rebuilding CD...")
-            self.root.update()
+            job["status"] = "Exporting: rebuilding CD..."
             file_count = rebuild_zip_central_directory(OUTPUT_ZIP)
 
-            self.status_var.set("Exporting: verifying...")
-            self.root.update()
+            # --- Step 2: Copy DLC loose ET files ---
+            # They don't depend on the ZIP, so the copies run while it is verified
+            job["status"] = "Exporting: verifying and copying DLC files..."
+            et_mapping = file_mapping.get("et_files", {})
+            try:
+                with os.scandir(DLC_ET_DIR) as it:
+                    dlc_entries = [e for e in it if e.name.endswith("_ET.xml") and e.is_file()]
+            except FileNotFoundError:
+                dlc_entries = []
+            dlc_copies = []
+            for e in dlc_entries:
+                fn = e.name
+                if has_override:
+                    dest = os.path.join(output_override, fn)
+                elif fn in et_mapping:
+                    dest = os.path.join(et_mapping[fn]["output_dir"], fn)
+                else:
+                    continue
+                dlc_copies.append((e.path, dest))
+            def _copy_dlc():
+                try:
+                    job["dlc_copied"] = copy_files(dlc_copies)
+                except Exception as e:
+                    job["dlc_error"] = e
+
+            dlc_worker = threading.Thread(target=_copy_dlc, daemon=True)
+            dlc_worker.start()
             valid, msg = verify_zip(OUTPUT_ZIP)
+            dlc_worker.join()
+            if "dlc_error" in job:
+                raise job["dlc_error"]
+            dlc_copied = job["dlc_copied"]
             if not valid:
-                raise RuntimeError(f"ZIP verification failed: {msg}")
+                # The DLC copies ran alongside the check, so they are already in place
+                raise RuntimeError(
+                    f"ZIP verification failed: {msg}\n\n"
+                    f"enginetuning.zip was not deployed, but {dlc_copied} DLC "
+                    f"file(s) had already been copied to the output folder(s).")
 
             # Determine ZIP destination
             if has_override:
                 dest_zip = os.path.join(output_override, "enginetuning.zip")
-            elif self.file_mapping.get("main_et_zip"):
-                dest_zip = self.file_mapping["main_et_zip"]
+            elif file_mapping.get("main_et_zip"):
+                dest_zip = file_mapping["main_et_zip"]
             else:
                 dest_zip = os.path.join(BASE_DIR, "enginetuning.zip")
 
             if os.path.normpath(dest_zip) != os.path.normpath(OUTPUT_ZIP):
                 os.makedirs(os.path.dirname(dest_zip), exist_ok=True)
-                shutil.copy2(OUTPUT_ZIP, dest_zip)
-
-            # --- Step 2: Copy DLC loose ET files ---
-            dlc_copied = 0
-            if os.path.isdir(DLC_ET_DIR):
-                et_mapping = self.file_mapping.get("et_files", {})
-                for fn in os.listdir(DLC_ET_DIR):
-                    if not fn.endswith("_ET.xml"):
-                        continue
-                    src = os.path.join(DLC_ET_DIR, fn)
-                    if has_override:
-                        dest = os.path.join(output_override, fn)
-                    elif fn in et_mapping:
-                        dest = os.path.join(et_mapping[fn]["output_dir"], fn)
-                    else:
-                        continue
-                    os.makedirs(os.path.dirname(dest), exist_ok=True)
-                    shutil.copy2(src, dest)
-                    dlc_copied += 1
+                copy_file(OUTPUT_ZIP, dest_zip)
 
             # --- Step 3: Copy loose override ET files ---
-            override_copied = 0
+            override_copies = []
             if not has_override:
-                et_mapping = self.file_mapping.get("et_files", {})
+                et_files = set(_list_xml_files(ET_DIR))  # one directory read instead of a stat per entry
+                # src and dest share the file name, so they match exactly when the dirs do;
+                # each distinct output dir is normalized once
+                et_dir_norm = os.path.normpath(ET_DIR)
+                is_et_dir = {}
                 for fn, info in et_mapping.items():
-                    src = os.path.join(ET_DIR, fn)
-                    if os.path.isfile(src):
-                        dest = os.path.join(info["output_dir"], fn)
-                        if os.path.normpath(src) != os.path.normpath(dest):
-                            os.makedirs(os.path.dirname(dest), exist_ok=True)
-                            shutil.copy2(src, dest)
-                            override_copied += 1
-
-            total_loose = dlc_copied + override_copied
-            self.status_var.set(f"Export complete: {file_count} ZIP files, {total_loose} loose files")
-            messagebox.showinfo("Export Complete",
-                                f"Main ZIP: {dest_zip}\n{msg}\n"
-                                f"DLC files copied: {dlc_copied}\n"
-                                f"Override files copied: {override_copied}")
-
-        except subprocess.TimeoutExpired:
+                    if fn in et_files:
+                        out_dir = info["output_dir"]
+                        same = is_et_dir.get(out_dir)
+                        if same is None:
+                            same = is_et_dir[out_dir] = os.path.normpath(out_dir) == et_dir_norm
+                        if not same:
+                            override_copies.append((os.path.join(ET_DIR, fn), os.path.join(out_dir, fn)))
+            override_copied = copy_files(override_copies)
+
+            job["result"] = (file_count, dest_zip, msg, dlc_copied, override_copied)
+        except Exception as e:
+            job["error"] = e
+
+    def _poll_export(self):
+        worker, job = self._export_job
+        if worker.is_alive():
+            if job["status"]:
+                self.status_var.set(job["status"])
+            self.root.after(100, self._poll_export)
+            return
+        self._export_job = None
+        self._set_file_ops_enabled(True)
+
+        error = job["error"]
+        if isinstance(error, subprocess.TimeoutExpired):
             messagebox.showerror("Timeout", "QuickBMS timed out.")
             self.status_var.set("Export failed")
-        except Exception as e:
-            messagebox.showerror("Export Failed", str(e))
+            return
+        if error is not None:
+            messagebox.showerror("Export Failed", str(error))
             self.status_var.set("Export failed")
+            return
+
+        file_count, dest_zip, msg, dlc_copied, override_copied = job["result"]
+        total_loose = dlc_copied + override_copied
+        self.status_var.set(f"Export complete: {file_count} ZIP files, {total_loose} loose files")
+        messagebox.showinfo("Export Complete",
+                            f"Main ZIP: {dest_zip}\n{msg}\n"
+                            f"DLC files copied: {dlc_copied}\n"
+                            f"Override files copied: {override_copied}")
 
     # ---- Backup / Restore ----
 
     def _on_backup(self):
+        if self._export_job is not None or self._find_job is not None:
+            return  # Buttons are greyed out; this covers any other way in
         if not self.mapping_loaded or not self.file_mapping:
             messagebox.showerror("No Mapping", "Run Find Files first to locate game files.")
             return
@@ -1919,42 +2553,33 @@ class FM4CarAudioTuner:
         os.makedirs(backup_dir, exist_ok=True)
 
         self.status_var.set("Backing up...")
-        self.root.update()
+        self._set_backup_buttons_enabled(False)
+        self.root.update_idletasks()
 
-        file_count = 0
         try:
-            # Copy main game ZIPs
+            # Collect main game ZIPs and DLC ET/HT files, then copy them together
+            copies = []
             main_et_zip = self.file_mapping.get("main_et_zip")
             if main_et_zip and os.path.isfile(main_et_zip):
-                shutil.copy2(main_et_zip, os.path.join(backup_dir, "enginetuning.zip"))
-                file_count += 1
+                copies.append((main_et_zip, os.path.join(backup_dir, "enginetuning.zip")))
 
             main_ht_zip = self.file_mapping.get("main_ht_zip")
             if main_ht_zip and os.path.isfile(main_ht_zip):
-                shutil.copy2(main_ht_zip, os.path.join(backup_dir, "harmonictuning.zip"))
-                file_count += 1
-
-            # Copy DLC ET files
-            et_files = self.file_mapping.get("et_files", {})
-            if et_files:
-                dlc_et_backup = os.path.join(backup_dir, "dlc_et")
-                os.makedirs(dlc_et_backup, exist_ok=True)
-                for fn, info in et_files.items():
-                    source = info.get("source_path", "")
-                    if source and os.path.isfile(source):
-                        shutil.copy2(source, os.path.join(dlc_et_backup, fn))
-                        file_count += 1
+                copies.append((main_ht_zip, os.path.join(backup_dir, "harmonictuning.zip")))
 
-            # Copy DLC HT files
-            ht_files = self.file_mapping.get("ht_files", {})
-            if ht_files:
-                dlc_ht_backup = os.path.join(backup_dir, "dlc_ht")
-                os.makedirs(dlc_ht_backup, exist_ok=True)
-                for fn, info in ht_files.items():
+            for key, sub in (("et_files", "dlc_et"), ("ht_files", "dlc_ht")):
+                dlc_backup = os.path.join(backup_dir, sub)
+                for fn, info in self.file_mapping.get(key, {}).items():
                     source = info.get("source_path", "")
                     if source and os.path.isfile(source):
-                        shutil.copy2(source, os.path.join(dlc_ht_backup, fn))
-                        file_count += 1
+                        copies.append((source, os.path.join(dlc_backup, fn)))
+
+            # Files left unchanged since an earlier backup into this folder keep their copy
+            # (copy_file preserves mtimes); they still count as backed up
+            file_count = len(copies)
+            copies = [(src, dest) for src, dest in copies if needs_copy(src, dest)]
+            copy_files(copies, progress=lambda done: self._show_copy_progress(
+                "Backing up", done, len(copies)))
 
             # Copy mapping
             shutil.copy2(FILE_MAPPING_PATH, os.path.join(backup_dir, "mapping.json"))
@@ -1966,8 +2591,38 @@ class FM4CarAudioTuner:
         except Exception as e:
             messagebox.showerror("Backup Failed", str(e))
             self.status_var.set("Backup failed")
+        finally:
+            self._set_backup_buttons_enabled(True)
+
+    def _set_backup_buttons_enabled(self, enabled):
+        """Grey out Backup / Restore Backup while either one is copying."""
+        state = ["!disabled"] if enabled else ["disabled"]
+        self.backup_btn.state(state)
+        self.restore_btn.state(state)
+
+    def _set_file_ops_enabled(self, enabled):
+        """Grey out every action that writes ET_DIR or the DLC folders.
+
+        Used while Export or Find Files runs in the background, so Save,
+        Backup/Restore and the other job can't change files it is reading.
+        """
+        state = ["!disabled"] if enabled else ["disabled"]
+        for btn in (self.save_btn, self.export_btn, self.find_btn):
+            btn.state(state)
+        self._set_backup_buttons_enabled(enabled)
+
+    def _show_copy_progress(self, action, done, total):
+        """Show copy progress, redrawing at most every 0.1 s (and always for the last file)."""
+        now = time.monotonic()
+        if done != total and now - self._progress_shown < 0.1:
+            return
+        self._progress_shown = now
+        self.status_var.set(f"{action}... {done}/{total}")
+        self.root.update_idletasks()
 
     def _on_restore_backup(self):
+        if self._export_job is not None or self._find_job is not None:
+            return  # Buttons are greyed out; this covers any other way in
         if not self.mapping_loaded or not self.file_mapping:
             messagebox.showerror("No Mapping", "Run Find Files first to locate game files.")
             return
@@ -1978,13 +2633,14 @@ class FM4CarAudioTuner:
             return
 
         backup_root = os.path.join(scan_root, "backups")
-        if not os.path.isdir(backup_root):
+        # List available backups
+        try:
+            with os.scandir(backup_root) as it:
+                backups = [e.name for e in it if e.is_dir()]
+        except (FileNotFoundError, NotADirectoryError):
             messagebox.showerror("No Backups", f"No backups directory found at:\n{backup_root}")
             return
-
-        # List available backups
-        backups = [d for d in os.listdir(backup_root)
-                   if os.path.isdir(os.path.join(backup_root, d))]
+        backups.sort(key=_natural_key)
         if not backups:
             messagebox.showerror("No Backups", "No backup folders found.")
             return
@@ -2004,86 +2660,87 @@ class FM4CarAudioTuner:
             ttk.Label(sel_win, text="Select a backup to restore:").pack(pady=(8, 4))
             lb = tk.Listbox(sel_win, height=8, font=("Consolas", 9))
             lb.pack(fill=tk.BOTH, expand=True, padx=8)
-            for b in sorted(backups):
-                lb.insert(tk.END, b)
+            lb.insert(tk.END, *backups)
 
-            result = {"value": None}
+            # Written once by Restore, a double-click or closing the window ("" = cancel)
+            picked = tk.StringVar(sel_win, value="")
 
-            def _select():
+            def _select(event=None):
                 s = lb.curselection()
-                if s:
-                    result["value"] = lb.get(s[0])
-                sel_win.destroy()
+                picked.set(lb.get(s[0]) if s else "")
 
             ttk.Button(sel_win, text="Restore", command=_select).pack(pady=8)
+            lb.bind("<Double-Button-1>", _select)
+            sel_win.protocol("WM_DELETE_WINDOW", lambda: picked.set(""))
 
-            self.root.wait_window(sel_win)
-            selected = result["value"]
+            sel_win.wait_variable(picked)
+            selected = picked.get()
+            sel_win.destroy()
             if not selected:
                 return
 
         backup_dir = os.path.join(backup_root, selected)
         mapping_path = os.path.join(backup_dir, "mapping.json")
 
-        # Read backup mapping
-        if os.path.isfile(mapping_path):
-            with open(mapping_path, "r") as f:
-                backup_mapping = json.load(f)
-        else:
+        # Read backup mapping (reparsed only if the file changed since the last restore)
+        try:
+            st = os.stat(mapping_path)
+        except FileNotFoundError:
             backup_mapping = self.file_mapping
+        else:
+            key = (mapping_path, st.st_mtime_ns, st.st_size)
+            if self._backup_mapping_cache[0] == key:
+                backup_mapping = self._backup_mapping_cache[1]
+            else:
+                with open(mapping_path, "rb") as f:
+                    backup_mapping = json.loads(f.read())
+                self._backup_mapping_cache = (key, backup_mapping)
 
         self.status_var.set("Restoring backup...")
-        self.root.update()
+        self._set_backup_buttons_enabled(False)
+        self.root.update_idletasks()
 
-        file_count = 0
         try:
-            # Restore main ET ZIP
-            et_zip_backup = os.path.join(backup_dir, "enginetuning.zip")
-            main_et_dest = backup_mapping.get("main_et_zip")
-            if os.path.isfile(et_zip_backup) and main_et_dest:
-                os.makedirs(os.path.dirname(main_et_dest), exist_ok=True)
-                shutil.copy2(et_zip_backup, main_et_dest)
-                file_count += 1
-
-            # Restore main HT ZIP
-            ht_zip_backup = os.path.join(backup_dir, "harmonictuning.zip")
-            main_ht_dest = backup_mapping.get("main_ht_zip")
-            if os.path.isfile(ht_zip_backup) and main_ht_dest:
-                os.makedirs(os.path.dirname(main_ht_dest), exist_ok=True)
-                shutil.copy2(ht_zip_backup, main_ht_dest)
-                file_count += 1
-
-            # Restore DLC ET files
-            dlc_et_backup = os.path.join(backup_dir, "dlc_et")
-            if os.path.isdir(dlc_et_backup):
-                et_mapping = backup_mapping.get("et_files", {})
-                for fn in os.listdir(dlc_et_backup):
-                    src = os.path.join(dlc_et_backup, fn)
-                    # Copy to mapped output_dir (game location)
-                    if fn in et_mapping:
-                        dest = os.path.join(et_mapping[fn]["output_dir"], fn)
-                        os.makedirs(os.path.dirname(dest), exist_ok=True)
-                        shutil.copy2(src, dest)
-                        file_count += 1
-                    # Also copy to working DLC_ET_DIR
-                    os.makedirs(DLC_ET_DIR, exist_ok=True)
-                    shutil.copy2(src, os.path.join(DLC_ET_DIR, fn))
-
-            # Restore DLC HT files
-            dlc_ht_backup = os.path.join(backup_dir, "dlc_ht")
-            if os.path.isdir(dlc_ht_backup):
-                ht_mapping = backup_mapping.get("ht_files", {})
-                for fn in os.listdir(dlc_ht_backup):
-                    src = os.path.join(dlc_ht_backup, fn)
-                    # Copy to mapped output_dir (game location)
-                    if fn in ht_mapping:
-                        dest = os.path.join(ht_mapping[fn]["output_dir"], fn)
-                        os.makedirs(os.path.dirname(dest), exist_ok=True)
-                        shutil.copy2(src, dest)
+            copies = []
+            file_count = 0  # game-location copies; the working-dir DLC copies aren't counted
+
+            # Restore main ET/HT ZIPs
+            for zip_name, mapping_key in (("enginetuning.zip", "main_et_zip"),
+                                          ("harmonictuning.zip", "main_ht_zip")):
+                zip_backup = os.path.join(backup_dir, zip_name)
+                main_dest = backup_mapping.get(mapping_key)
+                if os.path.isfile(zip_backup) and main_dest:
+                    copies.append((zip_backup, main_dest))
+                    file_count += 1
+
+            # Restore DLC ET/HT files to their mapped output_dir (game location)
+            # and to the working DLC dir
+            for sub, mapping_key, work_dir in (("dlc_et", "et_files", DLC_ET_DIR),
+                                               ("dlc_ht", "ht_files", DLC_HT_DIR)):
+                try:
+                    with os.scandir(os.path.join(backup_dir, sub)) as it:
+                        entries = [e for e in it if e.is_file()]
+                except FileNotFoundError:
+                    continue
+                # fn -> game-location dest, or None when that is the working dir itself
+                # (copies run concurrently, so one file must never be written twice)
+                work_norm = os.path.normpath(work_dir)
+                work_prefix = os.path.join(work_dir, "")  # work_dir plus separator
+                dest_map = {}
+                for fn, info in backup_mapping.get(mapping_key, {}).items():
+                    out_dir = info["output_dir"]
+                    dest_map[fn] = None if os.path.normpath(out_dir) == work_norm else os.path.join(out_dir, fn)
+                for e in entries:
+                    fn, src = e.name, e.path
+                    if fn in dest_map:
                         file_count += 1
-                    # Also copy to working DLC_HT_DIR
-                    os.makedirs(DLC_HT_DIR, exist_ok=True)
-                    shutil.copy2(src, os.path.join(DLC_HT_DIR, fn))
+                        dest = dest_map[fn]
+                        if dest is not None:
+                            copies.append((src, dest))
+                    copies.append((src, work_prefix + fn))
+
+            copy_files(copies, progress=lambda done: self._show_copy_progress(
+                "Restoring backup", done, len(copies)))
 
             self.status_var.set(f"Restore complete: {file_count} files from {selected}/")
             messagebox.showinfo("Restore Complete",
@@ -2093,11 +2750,56 @@ class FM4CarAudioTuner:
         except Exception as e:
             messagebox.showerror("Restore Failed", str(e))
             self.status_var.set("Restore failed")
+        finally:
+            self._set_backup_buttons_enabled(True)
+
+
+def _run_with_progress(root, title, text, func):
+    """Run func() on a worker thread behind a small busy window; return its result.
+
+    Tk events are pumped until the worker finishes, so the window keeps
+    repainting (no "Not Responding") even before mainloop has started.
+    func's exception, if any, is re-raised here.
+    """
+    win = tk.Toplevel(root)
+    win.title(title)
+    win.resizable(False, False)
+    win.protocol("WM_DELETE_WINDOW", lambda: None)  # Can't be cancelled midway
+    ttk.Label(win, text=text, justify=tk.CENTER).pack(padx=16, pady=(12, 6))
+    bar = ttk.Progressbar(win, mode="indeterminate", length=280)
+    bar.pack(padx=16, pady=(0, 12))
+    bar.start(10)
+
+    job = {"result": None, "error": None}
+
+    def _work():
+        try:
+            job["result"] = func()
+        except Exception as e:
+            job["error"] = e
+
+    worker = threading.Thread(target=_work, daemon=True)
+    worker.start()
+    done = tk.BooleanVar(win, value=False)
+
+    def _poll():
+        if worker.is_alive():
+            win.after(50, _poll)
+        else:
+            done.set(True)
+
+    win.after(50, _poll)
+    win.wait_variable(done)
+    bar.stop()
+    win.destroy()
+    if job["error"] is not None:
+        raise job["error"]
+    return job["result"]
 
 
 def _check_first_run():
     """Check if setup is needed and run it if so. Returns True if app should proceed."""
-    import io
+    import tempfile
     import urllib.request
     import zipfile as zf_mod
 
@@ -2106,7 +2808,11 @@ def _check_first_run():
 
     quickbms_ok = os.path.isfile(QUICKBMS_EXE)
     zipbms_ok = os.path.isfile(ZIP_BMS)
-    et_ok = os.path.isdir(ET_DIR) and any(f.endswith(".xml") for f in os.listdir(ET_DIR)) if os.path.isdir(ET_DIR) else False
+    try:
+        with os.scandir(ET_DIR) as it:
+            et_ok = any(e.name.endswith(".xml") for e in it)
+    except OSError:
+        et_ok = False
 
     if quickbms_ok and zipbms_ok and et_ok:
         return True  # All good, skip setup
@@ -2141,15 +2847,27 @@ def _check_first_run():
     # Step 1: Download QuickBMS
     if not quickbms_ok:
         try:
-            messagebox.showinfo("Downloading", "Downloading QuickBMS...\nThis may take a moment.")
             req = urllib.request.Request(QUICKBMS_URL, headers={
                 "User-Agent": "FM4CarAudioTuner-Setup/1.0"
             })
-            with urllib.request.urlopen(req, timeout=60) as resp:
-                data = resp.read()
-            os.makedirs(quickbms_dir, exist_ok=True)
-            with zf_mod.ZipFile(io.BytesIO(data)) as zfh:
-                zfh.extractall(quickbms_dir)
+
+            def _download():
+                # Stream to a temp file so the archive is never held in memory
+                tmp_path = None
+                try:
+                    with urllib.request.urlopen(req, timeout=60) as resp, \
+                            tempfile.NamedTemporaryFile(delete=False, suffix=".zip") as tf:
+                        tmp_path = tf.name
+                        shutil.copyfileobj(resp, tf, IO_BUFFER_SIZE)
+                    os.makedirs(quickbms_dir, exist_ok=True)
+                    with zf_mod.ZipFile(tmp_path) as zfh:
+                        zfh.extractall(quickbms_dir)
+                finally:
+                    if tmp_path is not None:
+                        os.unlink(tmp_path)
+
+            _run_with_progress(root, "Downloading",
+                               "Downloading QuickBMS...\nThis may take a moment.", _download)
         except Exception as e:
             messagebox.showerror("Download Failed",
                 f"Could not download QuickBMS:\n{e}\n\n"
@@ -2162,9 +2880,9 @@ def _check_first_run():
     # Step 2: Create zip.bms if missing
     if not zipbms_ok:
         try:
-            from setup_fm4tuner import ZIP_BMS_CONTENT
-            with open(ZIP_BMS, "w", newline="\n") as f:
-                f.write(ZIP_BMS_CONTENT)
+            from setup_fm4tuner import ZIP_BMS_CONTENT_BYTES
+            with open(ZIP_BMS, "wb") as f:
+                f.write(ZIP_BMS_CONTENT_BYTES)
         except ImportError:
             # Frozen exe - zip.bms must be shipped alongside or setup_fm4tuner.py run first
             messagebox.showerror("Missing File",
@@ -2185,55 +2903,80 @@ def _check_first_run():
             root.destroy()
             return True
 
-        # Search for ZIPs
-        et_zip = None
-        ht_zip = None
-        for dirpath, dirnames, filenames in os.walk(game_root):
-            for fn in filenames:
-                if fn == "enginetuning.zip":
-                    full = os.path.join(dirpath, fn)
-                    if et_zip is None or "DVD1" in dirpath:
-                        et_zip = full
-                elif fn == "harmonictuning.zip":
-                    full = os.path.join(dirpath, fn)
-                    if ht_zip is None or "DVD1" in dirpath:
-                        ht_zip = full
-
-        if et_zip:
-            backup_path = os.path.join(BASE_DIR, "enginetuning_backup.zip")
-            if not os.path.isfile(backup_path):
-                shutil.copy2(et_zip, backup_path)
-            os.makedirs(ET_DIR, exist_ok=True)
-            subprocess.run([QUICKBMS_EXE, ZIP_BMS, et_zip, ET_DIR],
-                           capture_output=True, timeout=300)
-
-        if ht_zip:
-            os.makedirs(HT_DIR, exist_ok=True)
-            subprocess.run([QUICKBMS_EXE, ZIP_BMS, ht_zip, HT_DIR],
-                           capture_output=True, timeout=300)
-
-        # Step 4: Deploy audioengineconfig.xml to game audio folder
         audio_config_src = os.path.join(BASE_DIR, "audioengineconfig.xml")
-        if os.path.isfile(audio_config_src):
-            # Find the game's Media\audio directory
+        reflections_src = os.path.join(BASE_DIR, "reflections.fev")
+        want_audio = os.path.isfile(audio_config_src)
+        want_reflections = os.path.isfile(reflections_src)
+
+        def _locate_and_extract():
+            # One walk finds the ZIPs (DVD1 copies preferred) and the folders that get
+            # audioengineconfig.xml / reflections.fev, stopping once nothing better can turn up
+            et_zip = None
+            ht_zip = None
+            et_dvd1 = ht_dvd1 = False
             audio_dir = None
-            for dirpath, dirnames, filenames in os.walk(game_root):
-                if "audioengineconfig.xml" in filenames:
+            reflections_dir = None
+            for dirpath, files in _walk_files(game_root):
+                names = {e.name for e in files}
+                in_dvd1 = "DVD1" in dirpath
+                if "enginetuning.zip" in names and (et_zip is None or in_dvd1):
+                    et_zip = os.path.join(dirpath, "enginetuning.zip")
+                    et_dvd1 = in_dvd1
+                if "harmonictuning.zip" in names and (ht_zip is None or in_dvd1):
+                    ht_zip = os.path.join(dirpath, "harmonictuning.zip")
+                    ht_dvd1 = in_dvd1
+                if audio_dir is None and "audioengineconfig.xml" in names:
                     audio_dir = dirpath
+                if reflections_dir is None and "reflections.fev" in names:
+                    reflections_dir = dirpath
+                if (et_dvd1 and ht_dvd1 and (audio_dir or not want_audio)
+                        and (reflections_dir or not want_reflections)):
                     break
-            if audio_dir:
-                shutil.copy2(audio_config_src, os.path.join(audio_dir, "audioengineconfig.xml"))
+
+            extractions = []
+            if et_zip:
+                backup_path = os.path.join(BASE_DIR, "enginetuning_backup.zip")
+                if not os.path.isfile(backup_path):
+                    copy_file(et_zip, backup_path)
+                os.makedirs(ET_DIR, exist_ok=True)
+                extractions.append((et_zip, ET_DIR))
+
+            if ht_zip:
+                os.makedirs(HT_DIR, exist_ok=True)
+                extractions.append((ht_zip, HT_DIR))
+
+            # The two extractions are independent, so run them side by side
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                for fut in [pool.submit(extract_game_zip, zip_path, dest_dir)
+                            for zip_path, dest_dir in extractions]:
+                    fut.result()
+            return audio_dir, reflections_dir
+
+        # Same extractor as standalone setup (in-process when possible, else QuickBMS)
+        try:
+            from setup_fm4tuner import extract_game_zip
+        except ImportError:
+            # Frozen exe built without setup_fm4tuner - run setup_fm4tuner.py instead
+            messagebox.showerror("Missing File",
+                "setup_fm4tuner.py is needed to extract the game ZIPs.\n\n"
+                "Run setup_fm4tuner.py from the GitHub repository, or use\n"
+                "Find Files in the tuner to locate extracted files.")
+            root.destroy()
+            return False
+
+        audio_dir, reflections_dir = _run_with_progress(
+            root, "Extracting", "Locating and extracting game files...", _locate_and_extract)
+
+        # Step 4: Deploy audioengineconfig.xml to game audio folder (Media\audio)
+        if want_audio and audio_dir:
+            shutil.copy2(audio_config_src, os.path.join(audio_dir, "audioengineconfig.xml"))
 
         # Step 5: Deploy reflections.fev to game Reflections folder
-        reflections_src = os.path.join(BASE_DIR, "reflections.fev")
-        if os.path.isfile(reflections_src):
-            for dirpath, dirnames, filenames in os.walk(game_root):
-                if "reflections.fev" in filenames:
-                    shutil.copy2(reflections_src, os.path.join(dirpath, "reflections.fev"))
-                    break
+        if want_reflections and reflections_dir:
+            shutil.copy2(reflections_src, os.path.join(reflections_dir, "reflections.fev"))
 
-        et_count = len([f for f in os.listdir(ET_DIR) if f.endswith(".xml")]) if os.path.isdir(ET_DIR) else 0
-        ht_count = len([f for f in os.listdir(HT_DIR) if f.endswith(".xml")]) if os.path.isdir(HT_DIR) else 0
+        et_count = len(_list_xml_files(ET_DIR))
+        ht_count = len(_list_xml_files(HT_DIR))
         messagebox.showinfo("Setup Complete",
             f"Extraction finished!\n\n"
             f"Engine Tuning files: {et_count}\n"
@@ -4,16 +4,16 @@ Downloads QuickBMS and extracts game tuning ZIPs.
 Run this before using the tuner, or let the tuner run it automatically.
 """
 
-import io
+import functools
 import os
+import queue
 import shutil
 import struct
-import subprocess
 import sys
-import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-import urllib.request
-import zipfile
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 if getattr(sys, "frozen", False):
     BASE_DIR = os.path.dirname(sys.executable)
@@ -27,6 +27,11 @@ ET_DIR = os.path.join(BASE_DIR, "enginetuning_extracted")
 HT_DIR = os.path.join(BASE_DIR, "harmonictuning_extracted")
 
 QUICKBMS_URL = "https://aluigi.altervista.org/papers/quickbms.zip"
+QUICKBMS_CACHE = os.path.join(BASE_DIR, ".quickbms_cache.zip")
+
+# Bound by _import_tk() when the setup window opens; headless runs and the
+# tuner's zip.bms import never load Tk
+tk = ttk = messagebox = filedialog = None
 
 # zip.bms content - the BMS script needed for Xbox 360 ZIP extraction
 ZIP_BMS_CONTENT = r'''# ZIP files example 0.4.12
@@ -351,6 +356,9 @@ for offset = offset < zip_filesize
     savepos offset
 next
 '''
+# Encoded once; zip.bms is written in binary so there is no per-write encode or
+# newline translation (the script uses LF endings)
+ZIP_BMS_CONTENT_BYTES = ZIP_BMS_CONTENT.encode("ascii")
 
 
 def check_needs_setup():
@@ -363,18 +371,206 @@ def check_needs_setup():
     return missing
 
 
+def _dir_is_empty(path):
+    """True if path is missing or has no entries (stops at the first one)."""
+    try:
+        with os.scandir(path) as it:
+            return next(it, None) is None
+    except (FileNotFoundError, NotADirectoryError):
+        return True
+
+
+def _count_xml_files(path):
+    """Number of .xml entries in path (0 if it does not exist)."""
+    try:
+        with os.scandir(path) as it:
+            return sum(1 for e in it if e.name.endswith(".xml"))
+    except (FileNotFoundError, NotADirectoryError):
+        return 0
+
+
 def check_needs_extraction():
     """Check if game ZIPs need to be extracted."""
     needs = []
-    if not os.path.isdir(ET_DIR) or not os.listdir(ET_DIR):
+    if _dir_is_empty(ET_DIR):
         needs.append("enginetuning")
-    if not os.path.isdir(HT_DIR) or not os.listdir(HT_DIR):
+    if _dir_is_empty(HT_DIR):
         needs.append("harmonictuning")
     return needs
 
 
+_GAME_ZIPS = {"enginetuning.zip", "harmonictuning.zip"}
+
+
+def _find_game_zips(game_root):
+    """Breadth-first search of game_root for (enginetuning.zip, harmonictuning.zip).
+
+    Either may be None. Directories named DVD1 are searched before their
+    siblings and a copy under a DVD1 path wins, as with the disc dumps' layout;
+    the search stops as soon as both ZIPs are found.
+    """
+    found = {}
+    pending = deque([game_root])
+    while pending and len(found) < 2:
+        d = pending.popleft()
+        dvd1_dirs, other_dirs = [], []
+        try:
+            with os.scandir(d) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        (dvd1_dirs if "DVD1" in entry.name else other_dirs).append(entry.path)
+                    elif entry.name in _GAME_ZIPS and entry.is_file():
+                        if entry.name not in found or "DVD1" in d:
+                            found[entry.name] = entry.path
+        except OSError:
+            continue  # Unreadable directory; os.walk skipped these too
+        pending.extend(dvd1_dirs)
+        pending.extend(other_dirs)
+    return found.get("enginetuning.zip"), found.get("harmonictuning.zip")
+
+
+def _import_tk():
+    global tk, ttk, messagebox, filedialog
+    import tkinter as tk
+    from tkinter import ttk, messagebox, filedialog
+
+
+def _download_quickbms():
+    """Fetch the QuickBMS zip and extract it into QUICKBMS_DIR.
+
+    The zip is kept as QUICKBMS_CACHE with its ETag alongside; a later run (say,
+    after quickbms.exe was deleted) sends If-None-Match and reuses the cached zip
+    on a 304 instead of downloading it again. The response is streamed to disk
+    in 1 MiB chunks. Returns (zip size, True if the cached copy was used).
+    """
+    import urllib.error
+    import urllib.request
+    import zipfile
+    headers = {
+        "User-Agent": "FM4CarAudioTuner-Setup/1.0",
+        "Accept-Encoding": "identity",  # already a zip; no gzip on top
+    }
+    etag_path = QUICKBMS_CACHE + ".etag"
+    if os.path.isfile(QUICKBMS_CACHE):
+        try:
+            with open(etag_path) as f:
+                etag = f.read().strip()
+        except OSError:
+            etag = ""
+        if etag:
+            headers["If-None-Match"] = etag
+    req = urllib.request.Request(QUICKBMS_URL, headers=headers)
+    part_path = QUICKBMS_CACHE + ".part"
+    try:
+        with urllib.request.urlopen(req, timeout=60) as resp, open(part_path, "wb") as out:
+            shutil.copyfileobj(resp, out, 1 << 20)
+            etag = resp.headers.get("ETag")
+        os.replace(part_path, QUICKBMS_CACHE)
+        if etag:
+            with open(etag_path, "w") as f:
+                f.write(etag)
+        elif os.path.isfile(etag_path):
+            os.remove(etag_path)
+        cached = False
+    except urllib.error.HTTPError as e:
+        if e.code != 304 or "If-None-Match" not in headers:
+            raise
+        cached = True
+    finally:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+    os.makedirs(QUICKBMS_DIR, exist_ok=True)
+    with zipfile.ZipFile(QUICKBMS_CACHE) as zf:
+        zf.extractall(QUICKBMS_DIR)
+    return os.path.getsize(QUICKBMS_CACHE), cached
+
+
+def _extract_member(zf, zi, out_dir):
+    try:
+        zf.extract(zi, out_dir)
+    except FileExistsError:
+        # Another worker created this entry's parent dir between extract's
+        # exists check and its makedirs; the dir is there now
+        zf.extract(zi, out_dir)
+
+
+def _move_into_place(tmp_dir, out_dir):
+    """Move a finished extraction from tmp_dir to out_dir, merging if out_dir has files."""
+    try:
+        os.rmdir(out_dir)  # The usual case: the empty folder the caller just made
+    except FileNotFoundError:
+        pass
+    except OSError:
+        shutil.copytree(tmp_dir, out_dir, dirs_exist_ok=True, copy_function=os.replace)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return
+    os.chmod(tmp_dir, 0o755)  # mkdtemp makes it owner-only
+    os.replace(tmp_dir, out_dir)
+
+
+def extract_game_zip(zip_path, out_dir, progress=None):
+    """Extract zip_path into out_dir; returns the extractor used.
+
+    Archives whose entries are all stored/deflate are extracted in-process with
+    zipfile (zlib), skipping the QuickBMS process; anything else, like the
+    Xbox 360 originals' XMemCompress entries (method 21), or anything zipfile
+    fails on partway, goes to QuickBMS. In-process entries are inflated and
+    written on a thread pool (zlib and file writes release the GIL); progress,
+    if given, is called with (entries done, entry count).
+
+    Both extractors write into a temp folder beside out_dir that is moved into
+    place only on success, so a failed run never leaves a half-filled out_dir
+    (which a later run would take as already extracted).
+    """
+    import subprocess
+    import zipfile
+    import zlib
+    parent = os.path.dirname(os.path.abspath(out_dir))
+    os.makedirs(parent, exist_ok=True)
+
+    tmp_dir = tempfile.mkdtemp(prefix=".extracting-", dir=parent)
+    try:
+        with zipfile.ZipFile(zip_path) as zf:
+            infos = zf.infolist()
+            if all(zi.compress_type in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED)
+                   for zi in infos):
+                workers = min(8, os.cpu_count() or 1)  # more just thrashes spinning disks
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    futures = [pool.submit(_extract_member, zf, zi, tmp_dir) for zi in infos]
+                    try:
+                        for done, fut in enumerate(as_completed(futures), 1):
+                            fut.result()
+                            if progress is not None:
+                                progress(done, len(infos))
+                    except BaseException:
+                        for fut in futures:
+                            fut.cancel()  # Stop queued entries; the temp dir is dropped
+                        raise
+                _move_into_place(tmp_dir, out_dir)
+                return "zipfile"
+    except (zipfile.BadZipFile, NotImplementedError, RuntimeError, ValueError,
+            EOFError, OSError, struct.error, zlib.error):
+        pass  # zipfile can't read it (odd header, bad CRC, encrypted...); QuickBMS handles it
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)  # No-op once moved into place
+
+    # A fresh folder, so QuickBMS never stops at an overwrite prompt; -o and
+    # stdin=DEVNULL make sure of it. Its per-file log is never read.
+    tmp_dir = tempfile.mkdtemp(prefix=".extracting-", dir=parent)
+    try:
+        result = subprocess.run([QUICKBMS_EXE, "-q", "-o", ZIP_BMS, zip_path, tmp_dir],
+                                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL, timeout=300)
+        if result.returncode == 0:
+            _move_into_place(tmp_dir, out_dir)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return "QuickBMS"
+
+
 class SetupWindow:
     def __init__(self):
+        _import_tk()
         self.root = tk.Tk()
         self.root.title("FM4 Car Audio Tuner - Setup")
         self.root.geometry("550x400")
@@ -427,6 +623,8 @@ class SetupWindow:
         ttk.Button(btn_frame, text="Close", command=self.root.destroy).pack(side=tk.RIGHT)
 
         self.success = False
+        self._ui_calls = queue.Queue()
+        self._setup_running = False
 
     def _browse(self):
         path = filedialog.askdirectory(title="Select game root directory")
@@ -438,7 +636,24 @@ class SetupWindow:
         self.log_text.insert(tk.END, msg + "\n")
         self.log_text.see(tk.END)
         self.log_text.configure(state=tk.DISABLED)
-        self.root.update()
+
+    def _post(self, func, *args, **kwargs):
+        """Queue a widget update from the setup worker for the Tk thread."""
+        self._ui_calls.put((func, args, kwargs))
+
+    def _drain_ui_calls(self):
+        running = self._setup_running  # read first so a finished worker's last posts get drained
+        while True:
+            try:
+                func, args, kwargs = self._ui_calls.get_nowait()
+            except queue.Empty:
+                break
+            func(*args, **kwargs)
+        if running:
+            self.root.after(50, self._drain_ui_calls)
+
+    def _post_extract_progress(self, label, done, total):
+        self._post(self.progress_var.set, f"Extracting {label}... {done}/{total} files")
 
     def _skip(self):
         self.success = True
@@ -446,140 +661,169 @@ class SetupWindow:
 
     def _run_setup(self):
         self.run_btn.configure(state=tk.DISABLED)
+        game_root = self.game_path_var.get().strip()
+        self._setup_running = True
+        threading.Thread(target=self._setup_thread, args=(game_root,), daemon=True).start()
+        self._drain_ui_calls()
+
+    def _setup_thread(self, game_root):
+        try:
+            self._run_setup_worker(game_root)
+        finally:
+            self._setup_running = False
+
+    def _run_setup_worker(self, game_root):
+        # Runs off the Tk thread; every widget update goes through self._post
+        # The game-root search needs neither QuickBMS nor zip.bms, so it runs
+        # alongside the download; the result is picked up in step 3
+        scan = {}
+
+        def _scan():
+            try:
+                scan["zips"] = _find_game_zips(game_root)
+            except Exception as e:
+                scan["error"] = e
+
+        scan_thread = None
+        if game_root and os.path.isdir(game_root):
+            scan_thread = threading.Thread(target=_scan, daemon=True)
+            scan_thread.start()
 
         try:
             # Step 1: Download QuickBMS
             if not os.path.isfile(QUICKBMS_EXE):
-                self.progress_var.set("Downloading QuickBMS...")
-                self.progress_bar["value"] = 10
-                self._log("Downloading QuickBMS from aluigi.altervista.org...")
+                self._post(self.progress_var.set, "Downloading QuickBMS...")
+                self._post(self.progress_bar.configure, value=10)
+                self._post(self._log, "Downloading QuickBMS from aluigi.altervista.org...")
 
                 try:
-                    req = urllib.request.Request(QUICKBMS_URL, headers={
-                        "User-Agent": "FM4CarAudioTuner-Setup/1.0"
-                    })
-                    with urllib.request.urlopen(req, timeout=60) as resp:
-                        data = resp.read()
-                    self._log(f"Downloaded {len(data)} bytes")
-
-                    os.makedirs(QUICKBMS_DIR, exist_ok=True)
-                    with zipfile.ZipFile(io.BytesIO(data)) as zf:
-                        zf.extractall(QUICKBMS_DIR)
-                    self._log(f"Extracted QuickBMS to {QUICKBMS_DIR}")
+                    size, cached = _download_quickbms()
+                    if cached:
+                        self._post(self._log, f"QuickBMS unchanged upstream; using cached zip ({size} bytes)")
+                    else:
+                        self._post(self._log, f"Downloaded {size} bytes")
+                    self._post(self._log, f"Extracted QuickBMS to {QUICKBMS_DIR}")
                 except Exception as e:
-                    self._log(f"ERROR downloading QuickBMS: {e}")
-                    self._log("You can manually download from: https://aluigi.altervista.org/quickbms.htm")
-                    self._log(f"Extract quickbms.exe into: {QUICKBMS_DIR}")
-                    self.run_btn.configure(state=tk.NORMAL)
+                    self._post(self._log, f"ERROR downloading QuickBMS: {e}")
+                    self._post(self._log, "You can manually download from: https://aluigi.altervista.org/quickbms.htm")
+                    self._post(self._log, f"Extract quickbms.exe into: {QUICKBMS_DIR}")
+                    self._post(self.run_btn.configure, state=tk.NORMAL)
                     return
             else:
-                self._log("QuickBMS already installed.")
+                self._post(self._log, "QuickBMS already installed.")
 
-            self.progress_bar["value"] = 30
+            self._post(self.progress_bar.configure, value=30)
 
             # Step 2: Create zip.bms
             if not os.path.isfile(ZIP_BMS):
-                self.progress_var.set("Creating zip.bms script...")
-                with open(ZIP_BMS, "w", newline="\n") as f:
-                    f.write(ZIP_BMS_CONTENT)
-                self._log("Created zip.bms script")
+                self._post(self.progress_var.set, "Creating zip.bms script...")
+                with open(ZIP_BMS, "wb") as f:
+                    f.write(ZIP_BMS_CONTENT_BYTES)
+                self._post(self._log, "Created zip.bms script")
             else:
-                self._log("zip.bms already exists.")
+                self._post(self._log, "zip.bms already exists.")
 
-            self.progress_bar["value"] = 40
+            self._post(self.progress_bar.configure, value=40)
 
             # Step 3: Find and extract game ZIPs
-            game_root = self.game_path_var.get().strip()
             if not game_root:
-                self._log("No game root specified - skipping ZIP extraction.")
-                self._log("You can use Find Files in the tuner later to locate game files.")
-                self.progress_bar["value"] = 100
-                self.progress_var.set("Setup complete (partial - no game ZIPs extracted)")
+                self._post(self._log, "No game root specified - skipping ZIP extraction.")
+                self._post(self._log, "You can use Find Files in the tuner later to locate game files.")
+                self._post(self.progress_bar.configure, value=100)
+                self._post(self.progress_var.set, "Setup complete (partial - no game ZIPs extracted)")
                 self.success = True
-                messagebox.showinfo("Setup Complete",
+                self._post(messagebox.showinfo, "Setup Complete",
                     "QuickBMS installed successfully.\n\n"
                     "To extract game files, use 'Find Files' in the tuner\n"
                     "or re-run setup with a game root path.")
                 return
 
             if not os.path.isdir(game_root):
-                self._log(f"ERROR: Path does not exist: {game_root}")
-                self.run_btn.configure(state=tk.NORMAL)
+                self._post(self._log, f"ERROR: Path does not exist: {game_root}")
+                self._post(self.run_btn.configure, state=tk.NORMAL)
                 return
 
             # Search for ZIPs
-            self.progress_var.set("Searching for game ZIPs...")
-            self._log(f"Searching {game_root} for tuning ZIPs...")
-            et_zip = None
-            ht_zip = None
-
-            for dirpath, dirnames, filenames in os.walk(game_root):
-                for fn in filenames:
-                    if fn == "enginetuning.zip":
-                        full = os.path.join(dirpath, fn)
-                        if et_zip is None or "DVD1" in dirpath:
-                            et_zip = full
-                    elif fn == "harmonictuning.zip":
-                        full = os.path.join(dirpath, fn)
-                        if ht_zip is None or "DVD1" in dirpath:
-                            ht_zip = full
-
-            self.progress_bar["value"] = 55
-
-            # Extract enginetuning.zip
+            self._post(self.progress_var.set, "Searching for game ZIPs...")
+            self._post(self._log, f"Searching {game_root} for tuning ZIPs...")
+            if scan_thread is not None:
+                scan_thread.join()
+            else:
+                _scan()  # game_root appeared after setup started
+            if "error" in scan:
+                raise scan["error"]
+            et_zip, ht_zip = scan["zips"]
+
+            self._post(self.progress_bar.configure, value=55)
+
+            # Counted once up front and after each extraction; a folder that
+            # already holds XMLs from an earlier run is not extracted again
+            et_count = _count_xml_files(ET_DIR)
+            ht_count = _count_xml_files(HT_DIR)
+
+            # Queue the ZIPs that need extracting; they go to separate folders,
+            # so both extractions run at once
+            extract_jobs = []
             if et_zip:
-                self._log(f"Found enginetuning.zip: {et_zip}")
+                self._post(self._log, f"Found enginetuning.zip: {et_zip}")
                 # Copy as backup
                 backup_path = os.path.join(BASE_DIR, "enginetuning_backup.zip")
                 if not os.path.isfile(backup_path):
                     shutil.copy2(et_zip, backup_path)
-                    self._log("Created enginetuning_backup.zip")
+                    self._post(self._log, "Created enginetuning_backup.zip")
 
-                os.makedirs(ET_DIR, exist_ok=True)
-                self.progress_var.set("Extracting enginetuning.zip (this may take a moment)...")
-                self._log("Extracting enginetuning.zip with QuickBMS...")
-                result = subprocess.run(
-                    [QUICKBMS_EXE, ZIP_BMS, et_zip, ET_DIR],
-                    capture_output=True, text=True, timeout=300)
-                et_count = len([f for f in os.listdir(ET_DIR) if f.endswith(".xml")])
-                self._log(f"Extracted {et_count} ET files")
+                if et_count:
+                    self._post(self._log, f"ET already extracted ({et_count} files), skipping")
+                else:
+                    extract_jobs.append(("ET", et_zip, ET_DIR))
             else:
-                self._log("WARNING: enginetuning.zip not found in game root")
+                self._post(self._log, "WARNING: enginetuning.zip not found in game root")
 
-            self.progress_bar["value"] = 75
-
-            # Extract harmonictuning.zip
             if ht_zip:
-                self._log(f"Found harmonictuning.zip: {ht_zip}")
-                os.makedirs(HT_DIR, exist_ok=True)
-                self.progress_var.set("Extracting harmonictuning.zip...")
-                self._log("Extracting harmonictuning.zip with QuickBMS...")
-                result = subprocess.run(
-                    [QUICKBMS_EXE, ZIP_BMS, ht_zip, HT_DIR],
-                    capture_output=True, text=True, timeout=300)
-                ht_count = len([f for f in os.listdir(HT_DIR) if f.endswith(".xml")])
-                self._log(f"Extracted {ht_count} HT files")
+                self._post(self._log, f"Found harmonictuning.zip: {ht_zip}")
+                if ht_count:
+                    self._post(self._log, f"HT already extracted ({ht_count} files), skipping")
+                else:
+                    extract_jobs.append(("HT", ht_zip, HT_DIR))
             else:
-                self._log("WARNING: harmonictuning.zip not found in game root")
-
-            self.progress_bar["value"] = 100
-            self.progress_var.set("Setup complete!")
+                self._post(self._log, "WARNING: harmonictuning.zip not found in game root")
+
+            if extract_jobs:
+                self._post(self.progress_var.set, "Extracting game ZIPs (this may take a moment)...")
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    futures = {}
+                    for label, zip_path, out_dir in extract_jobs:
+                        os.makedirs(out_dir, exist_ok=True)
+                        self._post(self._log, f"Extracting {os.path.basename(zip_path)}...")
+                        progress = functools.partial(self._post_extract_progress, label)
+                        futures[pool.submit(extract_game_zip, zip_path, out_dir, progress)] = (label, out_dir)
+                    for fut in as_completed(futures):
+                        label, out_dir = futures[fut]
+                        extractor = fut.result()
+                        count = _count_xml_files(out_dir)
+                        if label == "ET":
+                            et_count = count
+                        else:
+                            ht_count = count
+                        self._post(self._log, f"Extracted {count} {label} files ({extractor})")
+                        self._post(self.progress_bar.configure, value=75)
+
+            self._post(self.progress_bar.configure, value=100)
+            self._post(self.progress_var.set, "Setup complete!")
             self.success = True
 
-            et_count = len([f for f in os.listdir(ET_DIR) if f.endswith(".xml")]) if os.path.isdir(ET_DIR) else 0
-            ht_count = len([f for f in os.listdir(HT_DIR) if f.endswith(".xml")]) if os.path.isdir(HT_DIR) else 0
-            messagebox.showinfo("Setup Complete",
+            self._post(messagebox.showinfo, "Setup Complete",
                 f"Setup finished successfully!\n\n"
                 f"Engine Tuning files: {et_count}\n"
                 f"Harmonic Tuning files: {ht_count}\n\n"
                 f"You can now close this window and launch the tuner.")
 
         except Exception as e:
-            self._log(f"ERROR: {e}")
-            self.progress_var.set("Setup failed")
-            messagebox.showerror("Setup Error", str(e))
+            self._post(self._log, f"ERROR: {e}")
+            self._post(self.progress_var.set, "Setup failed")
+            self._post(messagebox.showerror, "Setup Error", str(e))
 
-        self.run_btn.configure(state=tk.NORMAL)
+        self._post(self.run_btn.configure, state=tk.NORMAL)
 
     def run(self):
         self.root.mainloop()
@@ -600,14 +844,7 @@ def run_setup_headless(game_root=None):
     if not os.path.isfile(QUICKBMS_EXE):
         print("Downloading QuickBMS...")
         try:
-            req = urllib.request.Request(QUICKBMS_URL, headers={
-                "User-Agent": "FM4CarAudioTuner-Setup/1.0"
-            })
-            with urllib.request.urlopen(req, timeout=60) as resp:
-                data = resp.read()
-            os.makedirs(QUICKBMS_DIR, exist_ok=True)
-            with zipfile.ZipFile(io.BytesIO(data)) as zf:
-                zf.extractall(QUICKBMS_DIR)
+            _download_quickbms()
             print("QuickBMS installed.")
             results.append("QuickBMS: installed")
         except Exception as e:
@@ -617,29 +854,30 @@ def run_setup_headless(game_root=None):
 
     # Create zip.bms
     if not os.path.isfile(ZIP_BMS):
-        with open(ZIP_BMS, "w", newline="\n") as f:
-            f.write(ZIP_BMS_CONTENT)
+        with open(ZIP_BMS, "wb") as f:
+            f.write(ZIP_BMS_CONTENT_BYTES)
         results.append("zip.bms: created")
 
     if game_root and os.path.isdir(game_root):
         # Find and extract ZIPs (same logic as GUI)
-        for dirpath, dirnames, filenames in os.walk(game_root):
-            for fn in filenames:
-                if fn == "enginetuning.zip":
-                    et_zip = os.path.join(dirpath, fn)
-                    os.makedirs(ET_DIR, exist_ok=True)
-                    backup_path = os.path.join(BASE_DIR, "enginetuning_backup.zip")
-                    if not os.path.isfile(backup_path):
-                        shutil.copy2(et_zip, backup_path)
-                    subprocess.run([QUICKBMS_EXE, ZIP_BMS, et_zip, ET_DIR],
-                                   capture_output=True, timeout=300)
-                    results.append(f"enginetuning: extracted")
-                elif fn == "harmonictuning.zip":
-                    ht_zip = os.path.join(dirpath, fn)
-                    os.makedirs(HT_DIR, exist_ok=True)
-                    subprocess.run([QUICKBMS_EXE, ZIP_BMS, ht_zip, HT_DIR],
-                                   capture_output=True, timeout=300)
-                    results.append(f"harmonictuning: extracted")
+        et_zip, ht_zip = _find_game_zips(game_root)
+        if et_zip:
+            backup_path = os.path.join(BASE_DIR, "enginetuning_backup.zip")
+            if not os.path.isfile(backup_path):
+                shutil.copy2(et_zip, backup_path)
+            if _count_xml_files(ET_DIR):
+                results.append("enginetuning: already extracted")
+            else:
+                os.makedirs(ET_DIR, exist_ok=True)
+                extract_game_zip(et_zip, ET_DIR)
+                results.append(f"enginetuning: extracted")
+        if ht_zip:
+            if _count_xml_files(HT_DIR):
+                results.append("harmonictuning: already extracted")
+            else:
+                os.makedirs(HT_DIR, exist_ok=True)
+                extract_game_zip(ht_zip, HT_DIR)
+                results.append(f"harmonictuning: extracted")
 
     return results
 